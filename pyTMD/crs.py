@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 u"""
 crs.py
-Written by Tyler Sutterley (09/2024)
+Written by Tyler Sutterley (10/2026)
 Coordinates Reference System (CRS) class
 
 CALLING SEQUENCE:
@@ -30,6 +30,7 @@ PYTHON DEPENDENCIES:
         https://pyproj4.github.io/pyproj/
 
 UPDATE HISTORY:
+    Updated 10/2026: cache transformers between coordinate reference systems
     Updated 09/2024: added function for idealized Arctic Azimuthal projection
         complete refactor to use JSON dictionary format for model projections
     Updated 07/2024: added function to get the CRS transform
@@ -56,6 +57,7 @@ UPDATE HISTORY:
 from __future__ import annotations
 
 import logging
+import functools
 import numpy as np
 from pyTMD.utilities import import_dependency
 # attempt imports
@@ -172,8 +174,7 @@ class crs:
         kwargs.setdefault('direction', self.direction)
         # get the coordinate reference system and transform
         source_crs = self.from_input(EPSG)
-        self.transformer = pyproj.Transformer.from_crs(
-            source_crs, self.crs, always_xy=True)
+        self.transformer = _transformer(source_crs, self.crs)
         # convert coordinate reference system
         o1, o2 = self.transformer.transform(i1, i2, **kwargs)
         # return the transformed coordinates
@@ -245,3 +246,25 @@ class crs:
 
     def __setitem__(self, key, value):
         setattr(self, key, value)
+
+# PURPOSE: build and cache transformers between reference systems
+@functools.lru_cache(maxsize=32)
+def _transformer(source_crs, target_crs):
+    """
+    Get a cached ``pyproj`` transformer between two
+    Coordinate Reference Systems
+
+    Parameters
+    ----------
+    source_crs: obj
+        ``pyproj`` source coordinate reference system
+    target_crs: obj
+        ``pyproj`` target coordinate reference system
+
+    Returns
+    -------
+    transformer: obj
+        ``pyproj`` transformer for changing coordinate reference system
+    """
+    return pyproj.Transformer.from_crs(source_crs, target_crs,
+        always_xy=True)
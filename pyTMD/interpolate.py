@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 u"""
 interpolate.py
-Written by Tyler Sutterley (09/2024)
+Written by Tyler Sutterley (10/2026)
 Interpolators for spatial data
 
 PYTHON DEPENDENCIES:
@@ -12,6 +12,16 @@ PYTHON DEPENDENCIES:
         https://docs.scipy.org/doc/
 
 UPDATE HISTORY:
+    Updated 10/2026: added spline_many for interpolating multiple layers
+        of data that share a common grid
+        vectorize bilinear interpolation over the output points
+        reuse precomputed linear spline weights for multiple calls
+        evaluate linear splines directly without fitting with FITPACK
+        access only the masks of grid points surrounding the output points
+        reuse precomputed bilinear weights for multiple calls
+        gather bilinear corner values and masks with single indices
+        reuse precomputed KD-trees of valid points for extrapolation
+        find grid cells in closed form for uniformly spaced grids
     Updated 09/2024: deprecation fix case where an array is output to scalars
     Updated 07/2024: changed projection flag in extrapolation to is_geographic
     Written 12/2022
@@ -26,8 +36,13 @@ import pyTMD.spatial
 __all__ = [
     "bilinear",
     "spline",
+    "spline_many",
     "regulargrid",
     "extrapolate",
+    "_bilinear_weights",
+    "_spline_weights",
+    "_grid_indices",
+    "_extrapolate_tree",
     "_distance"
 ]
 
@@ -39,7 +54,8 @@ def bilinear(
         lon: np.ndarray,
         lat: np.ndarray,
         fill_value: float = np.nan,
-        dtype: str | np.dtype = np.float64
+        dtype: str | np.dtype = np.float64,
+        weights: tuple | None = None
     ):
     """
     Bilinear interpolation of input data to output coordinates
@@ -60,19 +76,18 @@ def bilinear(
         invalid value
     dtype: np.dtype, default np.float64
         output data type
+    weights: tuple or NoneType, default None
+        precomputed grid indices and weights from ``_bilinear_weights``
 
     Returns
     -------
     data: np.ndarray
         interpolated data
     """
-    # verify that input data is masked array
-    if not isinstance(idata, np.ma.MaskedArray):
-        idata = np.ma.array(idata)
-        idata.mask = np.zeros_like(idata, dtype=bool)
-    # find valid points (within bounds)
-    valid, = np.nonzero((lon >= ilon.min()) & (lon <= ilon.max()) &
-        (lat > ilat.min()) & (lat < ilat.max()))
+    # calculate grid indices and weights for the output points
+    if weights is None:
+        weights = _bilinear_weights(ilon, ilat, lon, lat)
+    valid, XI, YI, WM, corners = weights
     # interpolate gridded data values to data
     npts = len(lon)
     # allocate to output interpolated data array
@@ -80,43 +95,91 @@ def bilinear(
     data.mask = np.ones((npts), dtype=bool)
     # initially set all data to fill value
     data.data[:] = data.fill_value
-    # for each valid point
-    for i in valid:
-        # calculating the indices for the original grid
-        ix, = np.nonzero((ilon[0:-1] <= lon[i]) & (ilon[1:] > lon[i]))
-        iy, = np.nonzero((ilat[0:-1] <= lat[i]) & (ilat[1:] > lat[i]))
-        # corner data values for adjacent grid cells
-        IM = np.ma.zeros((4), fill_value=fill_value, dtype=dtype)
-        IM.mask = np.ones((4), dtype=bool)
-        # corner weight values for adjacent grid cells
-        WM = np.zeros((4))
-        # build data and weight arrays
-        for j,XI,YI in zip([0,1,2,3],[ix,ix+1,ix,ix+1],[iy,iy,iy+1,iy+1]):
-            IM.data[j], = idata.data[YI,XI].astype(dtype)
-            IM.mask[j], = idata.mask[YI,XI]
-            WM[3-j], = np.abs(lon[i]-ilon[XI])*np.abs(lat[i]-ilat[YI])
-        # if on corner value: use exact
-        if (np.isclose(lat[i],ilat[iy]) & np.isclose(lon[i],ilon[ix])):
-            data.data[i] = np.squeeze(idata.data[iy,ix]).astype(dtype)
-            data.mask[i] = np.squeeze(idata.mask[iy,ix])
-        elif (np.isclose(lat[i],ilat[iy+1]) & np.isclose(lon[i],ilon[ix])):
-            data.data[i] = np.squeeze(idata.data[iy+1,ix]).astype(dtype)
-            data.mask[i] = np.squeeze(idata.mask[iy+1,ix])
-        elif (np.isclose(lat[i],ilat[iy]) & np.isclose(lon[i],ilon[ix+1])):
-            data.data[i] = np.squeeze(idata.data[iy,ix+1]).astype(dtype)
-            data.mask[i] = np.squeeze(idata.mask[iy,ix+1])
-        elif (np.isclose(lat[i],ilat[iy+1]) & np.isclose(lon[i],ilon[ix+1])):
-            data.data[i] = np.squeeze(idata.data[iy+1,ix+1]).astype(dtype)
-            data.mask[i] = np.squeeze(idata.mask[iy+1,ix+1])
-        elif np.any(np.isfinite(IM) & (~IM.mask)):
-            # find valid indices for data summation and weight matrix
-            ii, = np.nonzero(np.isfinite(IM) & (~IM.mask))
-            # calculate interpolated value for i
-            data.data[i] = np.sum(WM[ii]*IM[ii])/np.sum(WM[ii])
-            data.mask[i] = np.all(IM.mask[ii])
+    # corner data values and masks for adjacent grid cells
+    # gathered for all four corners with a single index
+    IM = np.ma.getdata(idata)[YI,XI].astype(dtype)
+    mask = np.ma.getmask(idata)
+    if mask is np.ma.nomask:
+        MM = np.zeros(IM.shape, dtype=bool)
+    else:
+        MM = mask[YI,XI]
+    # find valid corners for data summation and weight matrix
+    VM = np.isfinite(IM) & np.logical_not(MM)
+    WM = np.where(VM, WM, 0.0)
+    # calculate interpolated values from valid corners
+    ii, = np.nonzero(np.any(VM, axis=0))
+    numerator = np.sum(WM*np.where(VM, IM, 0.0), axis=0)
+    data.data[valid[ii]] = numerator[ii]/np.sum(WM[:,ii], axis=0)
+    data.mask[valid[ii]] = False
+    # if on corner value: use exact
+    for j, ii in corners:
+        data.data[valid[ii]] = IM[j,ii]
+        data.mask[valid[ii]] = MM[j,ii]
     # return interpolated values
     return data
 
+# PURPOSE: calculate grid indices and weights for bilinear interpolation
+def _bilinear_weights(
+        ilon: np.ndarray,
+        ilat: np.ndarray,
+        lon: np.ndarray,
+        lat: np.ndarray
+    ):
+    """
+    Calculate the grid indices and weights for bilinear interpolation
+
+    Parameters
+    ----------
+    ilon: np.ndarray
+        longitude of tidal model
+    ilat: np.ndarray
+        latitude of tidal model
+    lon: np.ndarray
+        output longitude
+    lat: np.ndarray
+        output latitude
+
+    Returns
+    -------
+    valid: np.ndarray
+        indices of output points within the grid bounds
+    XI: np.ndarray
+        column indices of the corners of the adjacent grid cells
+    YI: np.ndarray
+        row indices of the corners of the adjacent grid cells
+    WM: np.ndarray
+        corner weight values for adjacent grid cells
+    corners: list
+        corner and point indices for points on grid corners
+    """
+    # find valid points (within bounds)
+    valid, = np.nonzero((lon >= ilon.min()) & (lon <= ilon.max()) &
+        (lat > ilat.min()) & (lat < ilat.max()))
+    # coordinates of valid points
+    x, y = lon[valid], lat[valid]
+    # calculating the indices for the original grid
+    ix = _grid_indices(ilon, x)
+    iy = _grid_indices(ilat, y)
+    # points on the upper boundary use the last grid cell
+    ix = np.clip(ix, 0, len(ilon) - 2)
+    iy = np.clip(iy, 0, len(ilat) - 2)
+    # indices of the corners of the adjacent grid cells
+    XI = np.array([ix, ix+1, ix, ix+1])
+    YI = np.array([iy, iy, iy+1, iy+1])
+    # corner weight values for adjacent grid cells
+    # (area of the sub-cell opposite to each corner)
+    WM = np.abs(x - ilon[XI[::-1]])*np.abs(y - ilat[YI[::-1]])
+    # find points on corner values in order of precedence
+    corners = []
+    exact = np.zeros_like(valid, dtype=bool)
+    for j in [0, 2, 1, 3]:
+        ii, = np.nonzero(np.logical_not(exact) &
+            np.isclose(y, ilat[YI[j]]) & np.isclose(x, ilon[XI[j]]))
+        corners.append((j, ii))
+        exact[ii] = True
+    # return the valid points, corner indices and weights
+    return (valid, XI, YI, WM, corners)
+
 def spline(
         ilon: np.ndarray,
         ilat: np.ndarray,
@@ -167,6 +230,13 @@ def spline(
     # set default keyword arguments
     kwargs.setdefault('kx', 1)
     kwargs.setdefault('ky', 1)
+    # linear splines without smoothing are evaluated directly
+    # from the grid cells without fitting the splines
+    if (kwargs['kx'] == 1) and (kwargs['ky'] == 1) and \
+        not kwargs.get('s') and (kwargs.get('bbox') is None):
+        return spline_many(ilon, ilat, idata, lon, lat,
+            fill_value=fill_value, dtype=dtype, reducer=reducer,
+            **kwargs)
     # verify that input data is masked array
     if not isinstance(idata, np.ma.MaskedArray):
         idata = np.ma.array(idata)
@@ -199,6 +269,161 @@ def spline(
     # return interpolated values
     return data
 
+# PURPOSE: bivariate spline interpolation of multiple layers of input data
+def spline_many(
+        ilon: np.ndarray,
+        ilat: np.ndarray,
+        idata: np.ndarray,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        fill_value: float = None,
+        dtype: str | np.dtype = np.float64,
+        reducer=np.ceil,
+        weights: list | None = None,
+        **kwargs
+    ):
+    """
+    `Bivariate spline interpolation
+    <https://docs.scipy.org/doc/scipy/reference/generated/
+    scipy.interpolate.RectBivariateSpline.html>`_
+    of multiple layers of input data sharing a common grid
+
+    Parameters
+    ----------
+    ilon: np.ndarray
+        longitude of tidal model
+    ilat: np.ndarray
+        latitude of tidal model
+    idata: np.ndarray
+        tide model data with the grid in the last two dimensions
+    lat: np.ndarray
+        output latitude
+    lon: np.ndarray
+        output longitude
+    fill_value: float or NoneType, default None
+        invalid value
+    dtype: np.dtype, default np.float64
+        output data type
+    reducer: obj, default np.ceil
+        operation for converting mask to boolean
+    weights: list or NoneType, default None
+        precomputed grid indices and weights for linear splines
+        from ``_spline_weights``
+    kx: int, default 1
+        degree of the bivariate spline in the x-dimension
+    ky: int, default 1
+        degree of the bivariate spline in the y-dimension
+    kwargs: dict
+        additional arguments for ``scipy.interpolate.RectBivariateSpline``
+
+    Returns
+    -------
+    data: np.ndarray
+        interpolated data with the output points in the first dimension
+        and the leading dimensions of the input data in the remaining
+    """
+    # set default keyword arguments
+    kwargs.setdefault('kx', 1)
+    kwargs.setdefault('ky', 1)
+    # verify that input data is masked array
+    if not isinstance(idata, np.ma.MaskedArray):
+        idata = np.ma.array(idata)
+        idata.mask = np.zeros_like(idata, dtype=bool)
+    # reshape input data to be a stack of layers
+    *layers, ny, nx = np.shape(idata)
+    nl = int(np.prod(layers))
+    stack = np.ma.reshape(idata, (nl, ny, nx))
+    # interpolate gridded data values to data
+    npts = len(lon)
+    # allocate to output interpolated data array
+    data = np.ma.zeros((npts, nl), dtype=dtype, fill_value=fill_value)
+    data.mask = np.ones((npts, nl), dtype=bool)
+    # check if the splines are piecewise bilinear without smoothing
+    bilinear = (kwargs['kx'] == 1) and (kwargs['ky'] == 1) and \
+        not kwargs.get('s') and (kwargs.get('bbox') is None)
+    if bilinear:
+        # knots of a linear spline are the grid points, so the
+        # intervals and weights are calculated once for all layers
+        if weights is None:
+            weights = _spline_weights(ilon, ilat, lon, lat)
+        # evaluate the splines for the data of each layer
+        temp = np.zeros((nl, npts),
+            dtype=np.result_type(stack.data, np.float64))
+        for jj, ii, w in weights:
+            temp += w*stack.data[:, jj, ii]
+        data.data[:] = temp.T
+        # evaluate the splines for the mask of each layer
+        # only the grid points surrounding the output points are
+        # accessed so the cost is independent of the grid size
+        smask = np.ma.getmask(stack)
+        if smask is np.ma.nomask:
+            data.mask[:] = False
+        elif reducer is np.ceil:
+            # ceiling of an interpolated boolean mask is True
+            # for any masked corner with a positive weight
+            mask = np.zeros((nl, npts), dtype=bool)
+            for jj, ii, w in weights:
+                mask |= smask[:, jj, ii] & (w > 0.0)
+            data.mask[:] = mask.T
+        else:
+            mask = np.zeros((nl, npts))
+            for jj, ii, w in weights:
+                mask += w*smask[:, jj, ii]
+            data.mask[:] = reducer(mask.T).astype(bool)
+    else:
+        # use bivariate splines to interpolate each layer
+        for i in range(nl):
+            data[:,i] = spline(ilon, ilat, stack[i], lon, lat,
+                fill_value=fill_value, dtype=dtype, reducer=reducer,
+                **kwargs)
+    # return interpolated values
+    return np.ma.reshape(data, (npts, *layers))
+
+# PURPOSE: calculate grid indices and weights for linear splines
+def _spline_weights(
+        ilon: np.ndarray,
+        ilat: np.ndarray,
+        lon: np.ndarray,
+        lat: np.ndarray,
+    ):
+    """
+    Calculate the grid indices and weights for evaluating bivariate
+    linear splines at output coordinates
+
+    Parameters
+    ----------
+    ilon: np.ndarray
+        longitude of tidal model
+    ilat: np.ndarray
+        latitude of tidal model
+    lat: np.ndarray
+        output latitude
+    lon: np.ndarray
+        output longitude
+
+    Returns
+    -------
+    weights: list
+        row indices, column indices and weights for each corner
+        of the grid cells containing the output coordinates
+    """
+    nx, ny = len(ilon), len(ilat)
+    # points outside of the grid are clamped to the boundary
+    x = np.clip(lon, ilon[0], ilon[-1])
+    y = np.clip(lat, ilat[0], ilat[-1])
+    # indices of the grid cells containing the points
+    ix = np.clip(_grid_indices(ilon, x), 0, nx - 2)
+    iy = np.clip(_grid_indices(ilat, y), 0, ny - 2)
+    # fractional position of the points within each grid cell
+    wx = (x - ilon[ix])/(ilon[ix+1] - ilon[ix])
+    wy = (y - ilat[iy])/(ilat[iy+1] - ilat[iy])
+    # weights for each corner of the grid cell
+    weights = [(iy, ix, (1.0 - wy)*(1.0 - wx)),
+        (iy, ix+1, (1.0 - wy)*wx),
+        (iy+1, ix, wy*(1.0 - wx)),
+        (iy+1, ix+1, wy*wx)]
+    return weights
+
 def regulargrid(
         ilon: np.ndarray,
         ilat: np.ndarray,
@@ -286,6 +511,7 @@ def extrapolate(
         dtype: str | np.dtype = np.float64,
         cutoff: int | float = np.inf,
         is_geographic: bool = True,
+        tree: tuple | None = None,
         **kwargs
     ):
     """
@@ -315,6 +541,8 @@ def extrapolate(
         Set to ``np.inf`` to extrapolate for all points
     is_geographic: bool, default True
         input grid is in geographic coordinates
+    tree: tuple or NoneType, default None
+        precomputed KD-tree of valid points from ``_extrapolate_tree``
 
     Returns
     -------
@@ -339,10 +567,126 @@ def extrapolate(
     # initially set all data to fill value
     data.data[:] = idata.fill_value
 
-    # create combined valid mask
-    valid_mask = (~idata.mask) & np.isfinite(idata.data)
+    # calculate KD-tree of valid points close to output points
+    if tree is None:
+        # create combined valid mask
+        valid_mask = (~idata.mask) & np.isfinite(idata.data)
+        tree = _extrapolate_tree(ilon, ilat, valid_mask, lon, lat,
+            cutoff=cutoff, is_geographic=is_geographic)
+    # extract KD-tree, grid indices and output coordinates
+    kdtree, indy, indx, points = tree
+    # check if there are any valid points within the input bounds
+    if kdtree is None:
+        # return filled masked array
+        return data
+    # flattened valid data array
+    flattened = idata.data[indy, indx]
+
+    # query output data points and find nearest neighbor within cutoff
+    dd, ii = kdtree.query(points, k=1, distance_upper_bound=cutoff)
+    # spatially extrapolate using nearest neighbors
+    if np.any(np.isfinite(dd)):
+        ind, = np.nonzero(np.isfinite(dd))
+        data.data[ind] = flattened[ii[ind]]
+        data.mask[ind] = False
+    # return extrapolated values
+    return data
+
+# PURPOSE: find the grid cells containing points
+def _grid_indices(
+        grid: np.ndarray,
+        points: np.ndarray
+    ):
+    """
+    Find the indices of the grid cells containing points
+
+    Indices for uniformly spaced grids are estimated in closed form
+    and corrected to match binary searches of the grid
+
+    Parameters
+    ----------
+    grid: np.ndarray
+        sorted grid coordinates
+    points: np.ndarray
+        coordinates of points
+
+    Returns
+    -------
+    indices: np.ndarray
+        index of the last grid coordinate less than or equal to each point
+    """
+    # number of grid coordinates and the uniform grid spacing
+    n = len(grid)
+    step = (grid[-1] - grid[0])/(n - 1) if (n > 1) else 0.0
+    # use binary searches for short or irregularly spaced grids
+    if (n < 3) or (step <= 0) or not np.allclose(np.diff(grid), step):
+        return np.searchsorted(grid, points, side='right') - 1
+    # estimate the grid indices from the uniform spacing
+    estimate = np.floor((points - grid[0])/step)
+    # invalid points are sorted after all grid coordinates
+    estimate[np.isnan(estimate)] = n - 1
+    np.clip(estimate, -1, n - 1, out=estimate)
+    indices = estimate.astype(np.intp)
+    # correct estimates that are offset from the search results
+    while True:
+        lower = grid[np.clip(indices, 0, n - 1)]
+        upper = grid[np.clip(indices + 1, 0, n - 1)]
+        high = (indices >= 0) & (lower > points)
+        low = (indices < n - 1) & (upper <= points)
+        if not (np.any(high) or np.any(low)):
+            break
+        indices -= high
+        indices += low
+    # return the grid indices
+    return indices
+
+# PURPOSE: calculate KD-tree of valid points for extrapolation
+def _extrapolate_tree(
+        ilon: np.ndarray,
+        ilat: np.ndarray,
+        valid_mask: np.ndarray,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        cutoff: int | float = np.inf,
+        is_geographic: bool = True
+    ):
+    """
+    Calculate the KD-tree of valid model points for nearest-neighbor
+    extrapolation
+
+    Parameters
+    ----------
+    ilon: np.ndarray
+        x-coordinates of tidal model
+    ilat: np.ndarray
+        y-coordinates of tidal model
+    valid_mask: np.ndarray
+        valid points of tide model data
+    lon: np.ndarray
+        output x-coordinates
+    lat: np.ndarray
+        output y-coordinates
+    cutoff: float, default np.inf
+        return only neighbors within distance [km]
+    is_geographic: bool, default True
+        input grid is in geographic coordinates
+
+    Returns
+    -------
+    tree: scipy.spatial.cKDTree or NoneType
+        KD-tree of valid model points close to output points
+    indy: np.ndarray
+        row indices of the valid model points
+    indx: np.ndarray
+        column indices of the valid model points
+    points: np.ndarray
+        coordinates of output points
+    """
+    # verify output dimensions
+    lon = np.atleast_1d(lon)
+    lat = np.atleast_1d(lat)
     # reduce to model points within bounds of input points
-    valid_bounds = np.ones_like(idata.mask, dtype=bool)
+    valid_bounds = np.ones_like(valid_mask, dtype=bool)
 
     # calculate coordinates for nearest-neighbors
     if is_geographic:
@@ -362,7 +706,7 @@ def extrapolate(
         ymin, ymax = (np.min(ys), np.max(ys))
         zmin, zmax = (np.min(zs), np.max(zs))
         # reduce to model points within bounds of input points
-        valid_bounds = np.ones_like(idata.mask, dtype=bool)
+        valid_bounds = np.ones_like(valid_mask, dtype=bool)
         valid_bounds &= (gridx >= (xmin - 2.0*cutoff))
         valid_bounds &= (gridx <= (xmax + 2.0*cutoff))
         valid_bounds &= (gridy >= (ymin - 2.0*cutoff))
@@ -371,15 +715,13 @@ def extrapolate(
         valid_bounds &= (gridz <= (zmax + 2.0*cutoff))
         # check if there are any valid points within the input bounds
         if not np.any(valid_mask & valid_bounds):
-            # return filled masked array
-            return data
+            # no valid points to extrapolate
+            return (None, None, None, None)
         # find where input grid is valid and close to output points
         indy, indx = np.nonzero(valid_mask & valid_bounds)
         # create KD-tree of valid points
         tree = scipy.spatial.cKDTree(np.c_[gridx[indy, indx],
             gridy[indy, indx], gridz[indy, indx]])
-        # flattened valid data array
-        flattened = idata.data[indy, indx]
         # output coordinates
         points = np.c_[xs, ys, zs]
     else:
@@ -390,34 +732,24 @@ def extrapolate(
         xmin, xmax = (np.min(lon), np.max(lon))
         ymin, ymax = (np.min(lat), np.max(lat))
         # reduce to model points within bounds of input points
-        valid_bounds = np.ones_like(idata.mask, dtype=bool)
+        valid_bounds = np.ones_like(valid_mask, dtype=bool)
         valid_bounds &= (gridx >= (xmin - 2.0*cutoff))
         valid_bounds &= (gridx <= (xmax + 2.0*cutoff))
         valid_bounds &= (gridy >= (ymin - 2.0*cutoff))
         valid_bounds &= (gridy <= (ymax + 2.0*cutoff))
         # check if there are any valid points within the input bounds
         if not np.any(valid_mask & valid_bounds):
-            # return filled masked array
-            return data
+            # no valid points to extrapolate
+            return (None, None, None, None)
         # find where input grid is valid and close to output points
         indy, indx = np.nonzero(valid_mask & valid_bounds)
         # flattened model coordinates
         tree = scipy.spatial.cKDTree(np.c_[gridx[indy, indx],
             gridy[indy, indx]])
-        # flattened valid data array
-        flattened = idata.data[indy, indx]
         # output coordinates
         points = np.c_[lon, lat]
-
-    # query output data points and find nearest neighbor within cutoff
-    dd, ii = tree.query(points, k=1, distance_upper_bound=cutoff)
-    # spatially extrapolate using nearest neighbors
-    if np.any(np.isfinite(dd)):
-        ind, = np.nonzero(np.isfinite(dd))
-        data.data[ind] = flattened[ii[ind]]
-        data.mask[ind] = False
-    # return extrapolated values
-    return data
+    # return KD-tree with grid indices and output coordinates
+    return (tree, indy, indx, points)
 
 # PURPOSE: calculate Euclidean distances between points
 def _distance(c1: np.ndarray, c2: np.ndarray):
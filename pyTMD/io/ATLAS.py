@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 u"""
 ATLAS.py
-Written by Tyler Sutterley (11/2024)
+Written by Tyler Sutterley (10/2026)
 
 Reads files for a tidal model and makes initial calculations to run tide program
 Includes functions to extract tidal harmonic constants from OTIS tide models for
@@ -55,6 +55,12 @@ PROGRAM DEPENDENCIES:
     interpolate.py: interpolation routines for spatial data
 
 UPDATE HISTORY:
+    Updated 10/2026: calculate crop indices once and apply to each constituent
+        extend global matrices by concatenating data and masks
+        shift global grids with a single gather of the column indices
+        skip reordering grids that already start at the base longitude
+        find crop indices with binary searches of the sorted grid coordinates
+        allocate extended longitude arrays without zero-filling
     Updated 11/2024: expose buffer distance for cropping tide model data
     Updated 10/2024: fix error when using default bounds in extract_constants
     Updated 07/2024: added crop and bounds keywords for trimming model data
@@ -126,6 +132,7 @@ __all__ = [
     "_extend_array",
     "_extend_matrix",
     "_crop",
+    "_crop_indices",
     "_shift"
 ]
 
@@ -246,12 +253,12 @@ def extract_constants(
 
     # crop bathymetry data to (buffered) bounds
     # or adjust longitudinal convention to fit tide model
-    if kwargs['crop'] and np.any(bounds):
-        mlon, mlat = np.copy(lon), np.copy(lat)
-        bathymetry, lon, lat = _crop(bathymetry, mlon, mlat,
-            bounds=bounds,
-            buffer=buffer
-        )
+    crop = kwargs['crop'] and np.any(bounds)
+    if crop:
+        # calculate indices for cropping tide model data
+        rows, cols, lon, lat = _crop_indices(lon, lat, bounds,
+            buffer=buffer)
+        bathymetry = bathymetry[rows, cols]
     elif (np.min(ilon) < 0.0) & (np.max(lon) > 180.0):
         # input points convention (-180:180)
         # tide model convention (0:360)
@@ -323,11 +330,8 @@ def extract_constants(
         # append constituent to list
         constituents.append(cons)
         # crop tide model data to (buffered) bounds
-        if kwargs['crop'] and np.any(bounds):
-            hc, _, _ = _crop(hc, mlon, mlat,
-                bounds=bounds,
-                buffer=buffer
-            )
+        if crop:
+            hc = hc[rows, cols]
         # replace original values with extend matrices
         if is_global:
             hc = _extend_matrix(hc)
@@ -449,12 +453,12 @@ def read_constants(
     is_global = False
 
     # crop bathymetry data to (buffered) bounds
-    if kwargs['crop'] and np.any(kwargs['bounds']):
-        mlon, mlat = np.copy(lon), np.copy(lat)
-        bathymetry, lon, lat = _crop(bathymetry, mlon, mlat,
-            bounds=kwargs['bounds'],
-            buffer=kwargs['buffer'],
-        )
+    crop = kwargs['crop'] and np.any(kwargs['bounds'])
+    if crop:
+        # calculate indices for cropping tide model data
+        rows, cols, lon, lat = _crop_indices(lon, lat, kwargs['bounds'],
+            buffer=kwargs['buffer'])
+        bathymetry = bathymetry[rows, cols]
     # grid step size of tide model
     dlon = lon[1] - lon[0]
     # replace original values with extend arrays/matrices
@@ -480,11 +484,8 @@ def read_constants(
         hc, cons = read_netcdf_file(model_file, kwargs['type'],
             compressed=kwargs['compressed'])
         # crop tide model data to (buffered) bounds
-        if kwargs['crop'] and np.any(kwargs['bounds']):
-            hc, lon, lat = _crop(hc, mlon, mlat,
-                bounds=kwargs['bounds'],
-                buffer=kwargs['buffer'],
-            )
+        if crop:
+            hc = hc[rows, cols]
         # replace original values with extend matrices
         if is_global:
             hc = _extend_matrix(hc)
@@ -1223,7 +1224,7 @@ def _extend_array(input_array: np.ndarray, step_size: float):
         extended array
     """
     n = len(input_array)
-    temp = np.zeros((n+2), dtype=input_array.dtype)
+    temp = np.empty((n+2), dtype=input_array.dtype)
     # extended array [x-1,x0,...,xN,xN+1]
     temp[0] = input_array[0] - step_size
     temp[1:-1] = input_array[:]
@@ -1245,16 +1246,15 @@ def _extend_matrix(input_matrix: np.ndarray):
     temp: np.ndarray
         extended matrix
     """
-    ny, nx = np.shape(input_matrix)
-    # allocate for extended matrix
+    # extend matrix [xN,x0,...,xN,x0]
+    data = np.ma.getdata(input_matrix)
+    temp = np.concatenate((data[:,-1:], data, data[:,:1]), axis=1)
+    # extend mask separately for masked arrays
     if np.ma.isMA(input_matrix):
-        temp = np.ma.zeros((ny,nx+2), dtype=input_matrix.dtype)
-    else:
-        temp = np.zeros((ny,nx+2), dtype=input_matrix.dtype)
-    # extend matrix
-    temp[:,0] = input_matrix[:,-1]
-    temp[:,1:-1] = input_matrix[:,:]
-    temp[:,-1] = input_matrix[:,0]
+        mask = np.ma.getmask(input_matrix)
+        if (mask is not np.ma.nomask):
+            mask = np.concatenate((mask[:,-1:], mask, mask[:,:1]), axis=1)
+        temp = np.ma.array(temp, mask=mask)
     return temp
 
 # PURPOSE: crop tide model data to bounds
@@ -1290,30 +1290,76 @@ def _crop(
     lat: np.ndarray
         cropped latitude
     """
+    # calculate indices for cropping
+    rows, cols, lon, lat = _crop_indices(ilon, ilat, bounds,
+        buffer=buffer)
+    # crop matrix
+    temp = input_matrix[rows, cols]
+    # return cropped data
+    return (temp, lon, lat)
+
+# PURPOSE: calculate indices for cropping tide model data
+def _crop_indices(
+        ilon: np.ndarray,
+        ilat: np.ndarray,
+        bounds: list | tuple,
+        buffer: int | float = 0
+    ):
+    """
+    Calculate indices for cropping tide model data to bounds
+
+    Parameters
+    ----------
+    ilon: np.ndarray
+        longitude of tidal model
+    ilat: np.ndarray
+        latitude of tidal model
+    bounds: list, tuple
+        bounding box: ``[xmin, xmax, ymin, ymax]``
+    buffer: int or float, default 0
+        buffer to add to bounds for cropping
+
+    Returns
+    -------
+    rows: slice
+        row indices for cropping
+    cols: slice or np.ndarray
+        column indices for cropping
+    lon: np.ndarray
+        cropped longitude
+    lat: np.ndarray
+        cropped latitude
+    """
+    # column indices of the input grid
+    cols = np.arange(len(ilon))
     # adjust longitudinal convention of tide model
     if (np.min(bounds[:2]) < 0.0) & (np.max(ilon) > 180.0):
-        input_matrix, ilon = _shift(input_matrix, ilon,
+        cols, ilon = _shift(cols[np.newaxis,:], ilon,
             lon0=180.0, cyclic=360.0, direction='west')
     elif (np.max(bounds[:2]) > 180.0) & (np.min(ilon) < 0.0):
-        input_matrix, ilon = _shift(input_matrix, ilon,
+        cols, ilon = _shift(cols[np.newaxis,:], ilon,
             lon0=0.0, cyclic=360.0, direction='east')
     # unpack bounds and buffer
     xmin = bounds[0] - buffer
     xmax = bounds[1] + buffer
     ymin = bounds[2] - buffer
     ymax = bounds[3] + buffer
-    # find indices for cropping
-    yind = np.flatnonzero((ilat >= ymin) & (ilat <= ymax))
-    xind = np.flatnonzero((ilon >= xmin) & (ilon <= xmax))
+    # find indices for cropping from the sorted grid coordinates
+    i0 = np.searchsorted(ilon, xmin, side='left')
+    i1 = np.searchsorted(ilon, xmax, side='right')
+    j0 = np.searchsorted(ilat, ymin, side='left')
+    j1 = np.searchsorted(ilat, ymax, side='right')
     # slices for cropping axes
-    rows = slice(yind[0], yind[-1]+1)
-    cols = slice(xind[0], xind[-1]+1)
-    # crop matrix
-    temp = input_matrix[rows, cols]
-    lon = ilon[cols]
+    rows = slice(j0, j1)
+    lon = ilon[i0:i1]
     lat = ilat[rows]
-    # return cropped data
-    return (temp, lon, lat)
+    # use column slices if the grid was not shifted
+    if (cols.ndim == 1):
+        cols = slice(i0, i1)
+    else:
+        cols = cols[0, i0:i1]
+    # return the indices and cropped coordinates
+    return (rows, cols, lon, lat)
 
 # PURPOSE: shift a grid east or west
 def _shift(
@@ -1349,25 +1395,24 @@ def _shift(
     lon: np.ndarray
         shifted longitude
     """
-    # find the starting index if cyclic
-    offset = 0 if (np.fabs(ilon[-1]-ilon[0]-cyclic) > 1e-4) else 1
+    # find the starting index
+    n = len(ilon)
     i0 = np.argmin(np.fabs(ilon - lon0))
-    # shift longitudinal values
-    lon = np.zeros(ilon.shape, ilon.dtype)
-    lon[0:-i0] = ilon[i0:]
-    lon[-i0:] = ilon[offset: i0+offset]
+    # shift longitudinal values and data values
+    # if the grid does not already start at the new base longitude
+    if (i0 > 0):
+        # find the starting index of the wrapped columns if cyclic
+        offset = 0 if (np.fabs(ilon[-1]-ilon[0]-cyclic) > 1e-4) else 1
+        indices = np.r_[i0:n, offset:i0+offset]
+        lon = ilon[indices]
+        temp = input_matrix[:,indices]
+    else:
+        lon = ilon.copy()
+        temp = input_matrix
     # add or remove the cyclic
     if (direction == 'east'):
-        lon[-i0:] += cyclic
+        lon[n-i0:] += cyclic
     elif (direction == 'west'):
-        lon[0:-i0] -= cyclic
-    # allocate for shifted data
-    if np.ma.isMA(input_matrix):
-        temp = np.ma.zeros(input_matrix.shape,input_matrix.dtype)
-    else:
-        temp = np.zeros(input_matrix.shape, input_matrix.dtype)
-    # shift data values
-    temp[:,:-i0] = input_matrix[:,i0:]
-    temp[:,-i0:] = input_matrix[:,offset: i0+offset]
+        lon[:n-i0] -= cyclic
     # return the shifted values
     return (temp, lon)
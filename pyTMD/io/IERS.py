@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 u"""
 IERS.py
-Written by Tyler Sutterley (08/2024)
+Written by Tyler Sutterley (10/2026)
 
 Reads ocean pole load tide coefficients provided by IERS
 http://maia.usno.navy.mil/conventions/2010/2010_official/chapter7/tn36_c7.pdf
@@ -31,6 +31,9 @@ REFERENCES:
         doi: 10.1007/s00190-015-0848-7
 
 UPDATE HISTORY:
+    Updated 10/2026: shift grids with a single gather of the row indices
+        skip reordering grids that already start at the base longitude
+        allocate extended longitude arrays without zero-filling
     Updated 08/2024: convert outputs to be in -180:180 longitude convention
         added function to interpolate ocean pole tide values to coordinates
         renamed from ocean_pole_tide to IERS
@@ -237,7 +240,7 @@ def _extend_array(input_array: np.ndarray, step_size: float):
         extended array
     """
     n = len(input_array)
-    temp = np.zeros((n+2), dtype=input_array.dtype)
+    temp = np.empty((n+2), dtype=input_array.dtype)
     # extended array [x-1,x0,...,xN,xN+1]
     temp[0] = input_array[0] - step_size
     temp[1:-1] = input_array[:]
@@ -300,25 +303,24 @@ def _shift(
     lon: np.ndarray
         shifted longitude
     """
-    # find the starting index if cyclic
-    offset = 0 if (np.fabs(ilon[-1]-ilon[0]-cyclic) > 1e-4) else 1
+    # find the starting index
+    n = len(ilon)
     i0 = np.argmin(np.fabs(ilon - lon0))
-    # shift longitudinal values
-    lon = np.zeros(ilon.shape, ilon.dtype)
-    lon[0:-i0] = ilon[i0:]
-    lon[-i0:] = ilon[offset: i0+offset]
+    # shift longitudinal values and data values
+    # if the grid does not already start at the new base longitude
+    if (i0 > 0):
+        # find the starting index of the wrapped rows if cyclic
+        offset = 0 if (np.fabs(ilon[-1]-ilon[0]-cyclic) > 1e-4) else 1
+        indices = np.r_[i0:n, offset:i0+offset]
+        lon = ilon[indices]
+        temp = input_matrix[indices,:]
+    else:
+        lon = ilon.copy()
+        temp = input_matrix
     # add or remove the cyclic
     if (direction == 'east'):
-        lon[-i0:] += cyclic
+        lon[n-i0:] += cyclic
     elif (direction == 'west'):
-        lon[0:-i0] -= cyclic
-    # allocate for shifted data
-    if np.ma.isMA(input_matrix):
-        temp = np.ma.zeros(input_matrix.shape,input_matrix.dtype)
-    else:
-        temp = np.zeros(input_matrix.shape, input_matrix.dtype)
-    # shift data values
-    temp[:-i0,:] = input_matrix[i0:, :]
-    temp[-i0:,:] = input_matrix[offset: i0+offset, :]
+        lon[:n-i0] -= cyclic
     # return the shifted values
     return (temp, lon)
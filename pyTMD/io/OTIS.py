@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 u"""
 OTIS.py
-Written by Tyler Sutterley (12/2024)
+Written by Tyler Sutterley (10/2026)
 
 Reads files for a tidal model and makes initial calculations to run tide program
 Includes functions to extract tidal harmonic constants from OTIS tide models for
@@ -27,7 +27,7 @@ OPTIONS:
         V: vertical depth-averaged transport
     method: interpolation method
         bilinear: quick bilinear interpolation
-        spline: scipy bivariate spline interpolation
+        spline: linear bivariate spline interpolation
         linear, nearest: scipy regular grid interpolations
     extrapolate: extrapolate model using nearest-neighbors
     cutoff: extrapolation cutoff in kilometers
@@ -37,6 +37,7 @@ OPTIONS:
         TMD3: combined global or local netCDF4 solution
         OTIS: combined global or local solution
     apply_flexure: apply ice flexure scaling factor to constituents
+    threads: maximum number of threads for processing OTIS constituents
 
 OUTPUTS:
     amplitude: amplitudes of tidal constituents
@@ -58,6 +59,69 @@ PROGRAM DEPENDENCIES:
     interpolate.py: interpolation routines for spatial data
 
 UPDATE HISTORY:
+    Updated 10/2026: stack interpolated constituents for amplitude and phase
+        calculate crop indices once and apply to each constituent
+        read multi-constituent elevation files as a single array
+        wrap input longitudes into the model convention with a modulo
+        reuse linear spline weights for the bathymetry and constituents
+        convert phase to degrees and wrap in place
+        open TMD3 netCDF4 files once when reading all constituents
+        use periodic spline indices rather than extending global constituents
+        interpolate OTIS constituents in parallel using a pool of threads
+        compute invalid constituent values once without masked temporaries
+        find crop indices with binary searches of the sorted grid coordinates
+        avoid copying input coordinates and constituent grid coordinates
+        use the end points of the sorted grid coordinates as model bounds
+        skip merging bathymetry masks into constituents for linear splines
+        cache model grids for repeated calls to extract constants
+        remove copy of deprecated keyword arguments
+        calculate phases in place from views of the complex constituents
+        read global constituent records with single bulk complex reads
+        scatter local ATLAS constituents as complex values
+        reuse bilinear interpolation weights for all constituents
+        interpolate constants without modifying the model constituents
+        reuse linear spline weights when interpolating constants
+        memory-map OTIS elevation and transport constituent records
+        cache the structure of ATLAS elevation and transport files
+        convert interpolated constants to amplitude and phase in one pass
+        convert local ATLAS indices to zero-based once when reading
+        decode constituent names with a single string split
+        read OTIS constituents in parallel using a pool of threads
+        avoid a duplicate copy of the bathymetry mask when interpolating
+        accumulate checks of the model bounds in place
+        read transport records with a structured complex dtype
+        reuse KD-trees of valid points when extrapolating constituents
+        parse local ATLAS grid solutions from a single buffered read
+        calculate amplitudes and phases as arrays before masking
+        read grid matrices with a single structured record
+        write each elevation and transport constituent with a single buffer
+        fix duplicate bathymetry record in output grid files
+        extend global matrices by concatenating data and masks
+        fill local ATLAS solutions using indices of each row and column
+        resample global ATLAS solutions with separable bilinear weights
+        broadcast row and column indices when resampling the ATLAS mask
+        interpolate to u and v nodes with slices rather than padded copies
+        write grid depth and mask records as single big-endian arrays
+        shift global grids with a single gather of the column indices
+        skip reordering grids that already start at the base longitude
+        reuse u and v node masks when interpolating bathymetry to nodes
+        read TMD3 variables contiguously and flip orientation in memory
+        interleave all output constituents into one big-endian buffer
+        allow writing OTIS files to open binary file objects
+        write each OTIS file header with a single big-endian record
+        fill local ATLAS solutions with flattened indices
+        allocate extended longitude arrays without zero-filling
+        interleave output constituents in threads while writing to file
+        process OTIS constituents serially unless threads are requested
+        bound the default number of threads for reading OTIS constituents
+        write constituents as they are interleaved with a bounded pool
+        set cached model grids as read-only
+        wrap longitudes after staggering the grid for u and v nodes
+        use coordinate reference system class when reading constants
+        interpolate data values of masked global ATLAS solutions
+        remove unused scipy import and describe linear spline interpolation
+        write records serially without a thread pool for a single thread
+        use a single default number of threads for reading and writing
     Updated 12/2024: released version of TMD3 has different variable names
     Updated 11/2024: expose buffer distance for cropping tide model data
     Updated 10/2024: save latitude and longitude to output constituent object
@@ -126,12 +190,14 @@ UPDATE HISTORY:
 """
 from __future__ import division, annotations
 
-import copy
+import io
+import os
 import struct
+import functools
 import logging
 import pathlib
+import concurrent.futures
 import numpy as np
-import scipy.interpolate
 import pyTMD.crs
 import pyTMD.interpolate
 import pyTMD.io.constituents
@@ -149,6 +215,7 @@ __all__ = [
     "read_netcdf_grid",
     "read_constituents",
     "read_otis_elevation",
+    "read_otis_elevation_stack",
     "read_atlas_elevation",
     "read_otis_transport",
     "read_atlas_transport",
@@ -162,6 +229,8 @@ __all__ = [
     "_extend_array",
     "_extend_matrix",
     "_crop",
+    "_crop_indices",
+    "_local_indices",
     "_shift",
     "_mask_nodes",
     "_interpolate_mask",
@@ -220,7 +289,7 @@ def extract_constants(
         Interpolation method
 
             - ``'bilinear'``: quick bilinear interpolation
-            - ``'spline'``: scipy bivariate spline interpolation
+            - ``'spline'``: linear bivariate spline interpolation
             - ``'linear'``, ``'nearest'``: scipy regular grid interpolations
     extrapolate: bool, default False
         Extrapolate model using nearest-neighbors
@@ -230,6 +299,10 @@ def extract_constants(
         Set to ``np.inf`` to extrapolate for all points
     apply_flexure: bool, default False
         Apply ice flexure scaling factor to height values
+    threads: int, default from ``PYTMD_NTHREADS`` or 1
+        Maximum number of threads for interpolating OTIS constituents
+
+        Each thread holds a full model constituent in memory
 
     Returns
     -------
@@ -252,6 +325,7 @@ def extract_constants(
     kwargs.setdefault('extrapolate', False)
     kwargs.setdefault('cutoff', 10.0)
     kwargs.setdefault('apply_flexure', False)
+    kwargs.setdefault('threads', _default_threads())
     # raise warnings for deprecated keyword arguments
     deprecated_keywords = dict(TYPE='type',METHOD='method',
         EXTRAPOLATE='extrapolate',CUTOFF='cutoff',GRID='grid')
@@ -260,7 +334,7 @@ def extract_constants(
             logging.warning(f"""Deprecated keyword argument {old}.
                 Changed to '{new}'""")
             # set renamed argument to not break workflows
-            kwargs[new] = copy.copy(kwargs[old])
+            kwargs[new] = kwargs[old]
 
     # check that grid file is accessible
     grid_file = pathlib.Path(grid_file).expanduser()
@@ -268,23 +342,20 @@ def extract_constants(
         raise FileNotFoundError(str(grid_file))
 
     # read the OTIS-format tide grid file
+    # grids are cached for repeated calls with the same model
+    xi,yi,hz,mz,ancillary = _read_grid(str(grid_file.resolve()),
+        grid_file.stat().st_mtime_ns, grid=kwargs['grid'])
     if (kwargs['grid'] == 'ATLAS'):
-        # if reading a global solution with localized solutions
-        x0,y0,hz0,mz0,iob,dt,pmask,local = read_atlas_grid(grid_file)
-        xi,yi,hz = combine_atlas_model(x0,y0,hz0,pmask,local,variable='depth')
-        mz = create_atlas_mask(x0,y0,mz0,local,variable='depth')
+        # global grid for combining with localized solutions
+        x0,y0,pmask = ancillary
     elif (kwargs['grid'] == 'TMD3'):
-        # if reading a single TMD3 netCDF4 solution
-        xi,yi,hz,mz,sf = read_netcdf_grid(grid_file)
-    else:
-        # if reading a single OTIS solution
-        xi,yi,hz,mz,iob,dt = read_otis_grid(grid_file)
-    # invert tide mask to be True for invalid points
-    mz = np.logical_not(mz).astype(mz.dtype)
+        # ice flexure scaling factor
+        sf = ancillary
 
     # adjust dimensions of input coordinates to be iterable
-    ilon = np.atleast_1d(np.copy(ilon))
-    ilat = np.atleast_1d(np.copy(ilat))
+    # transformed coordinates are new arrays so inputs are not copied
+    ilon = np.atleast_1d(ilon)
+    ilat = np.atleast_1d(ilat)
     # run wrapper function to convert coordinate systems of input lat/lon
     crs = pyTMD.crs().get(projection)
     x,y = crs.transform(ilon, ilat, direction='FORWARD')
@@ -302,19 +373,11 @@ def extract_constants(
     # crop mask and bathymetry data to (buffered) bounds
     # or adjust longitudinal convention to fit tide model
     if kwargs['crop'] and np.any(bounds):
-        mx, my = np.copy(xi), np.copy(yi)
-        mz, xi, yi = _crop(mz, mx, my, bounds=bounds,
-            buffer=buffer, is_geographic=is_geographic)
-        hz, xi, yi = _crop(hz, mx, my, bounds=bounds,
+        # calculate indices for cropping tide model data
+        rows, cols, xi, yi = _crop_indices(xi, yi, bounds=bounds,
             buffer=buffer, is_geographic=is_geographic)
-    elif (np.min(x) < np.min(xi)) & is_geographic:
-        # input points convention (-180:180)
-        # tide model convention (0:360)
-        x[x < 0] += 360.0
-    if (np.max(x) > np.max(xi)) & is_geographic:
-        # input points convention (0:360)
-        # tide model convention (-180:180)
-        x[x > 180] -= 360.0
+        mz = mz[rows, cols]
+        hz = hz[rows, cols]
 
     # if global: extend limits
     is_global = False
@@ -324,9 +387,6 @@ def extract_constants(
         # set global grid flag
         is_global = True
 
-    # determine if any input points are outside of the model bounds
-    invalid = (x < xi.min()) | (x > xi.max()) | (y < yi.min()) | (y > yi.max())
-
     # update masks for each type
     if (kwargs['type'] == 'z'):
         # replace original values with extend matrices
@@ -339,7 +399,7 @@ def extract_constants(
     elif kwargs['type'] in ('u','U'):
         # interpolate masks and bathymetry to u, v nodes
         mu,mv = _mask_nodes(hz, is_global=is_global)
-        hu,hv = _interpolate_zeta(hz, is_global=is_global)
+        hu,hv = _interpolate_zeta(hz, is_global=is_global, mu=mu, mv=mv)
         # invert current masks to be True for invalid points
         mu = np.logical_not(mu).astype(mu.dtype)
         # replace original values with extend matrices
@@ -350,11 +410,11 @@ def extract_constants(
         mask = (hu == 0) | mu.astype(bool)
         bathymetry = np.ma.array(hu, mask=mask)
         # x-coordinates for u transports
-        xi -= dx/2.0
+        xi = xi - dx/2.0
     elif kwargs['type'] in ('v','V'):
         # interpolate masks and bathymetry to u, v nodes
         mu,mv = _mask_nodes(hz, is_global=is_global)
-        hu,hv = _interpolate_zeta(hz, is_global=is_global)
+        hu,hv = _interpolate_zeta(hz, is_global=is_global, mu=mu, mv=mv)
         # invert current masks to be True for invalid points
         mv = np.logical_not(mv).astype(mv.dtype)
         # replace original values with extend matrices
@@ -365,22 +425,43 @@ def extract_constants(
         mask = (hv == 0) | mv.astype(bool)
         bathymetry = np.ma.array(hv, mask=mask)
         # y-coordinates for v transports
-        yi -= dy/2.0
+        yi = yi - dy/2.0
+
+    # wrap longitudes of input points into the tide model convention
+    # using the (staggered) model grid coordinates for each type
+    if is_geographic:
+        np.subtract(x, xi[0], out=x)
+        np.mod(x, 360.0, out=x)
+        np.add(x, xi[0], out=x)
+
+    # determine if any input points are outside of the model bounds
+    # model grid coordinates are uniform and sorted
+    # accumulate the bounds checks into a single boolean array
+    invalid = np.less(x, xi[0])
+    invalid |= np.greater(x, xi[-1])
+    invalid |= np.less(y, yi[0])
+    invalid |= np.greater(y, yi[-1])
 
     # interpolate bathymetry and mask to output points
     if (kwargs['method'] == 'bilinear'):
         # replace invalid values with nan
-        bathymetry.data[bathymetry.mask] = np.nan
+        bathymetry = np.ma.array(bathymetry.filled(np.nan),
+            mask=bathymetry.mask)
+        # calculate grid indices and weights for bilinear interpolation
+        weights = pyTMD.interpolate._bilinear_weights(xi, yi, x, y)
         # use quick bilinear to interpolate values
         D = pyTMD.interpolate.bilinear(xi, yi, bathymetry, x, y,
-            fill_value=np.ma.default_fill_value(np.dtype(float)))
+            fill_value=np.ma.default_fill_value(np.dtype(float)),
+            weights=weights)
         # replace nan values with fill_value
         D.mask[:] |= np.isnan(D.data)
         D.data[D.mask] = D.fill_value
     elif (kwargs['method'] == 'spline'):
-        # use scipy bivariate splines to interpolate values
-        D = pyTMD.interpolate.spline(xi, yi, bathymetry, x, y,
-            reducer=np.ceil, kx=1, ky=1)
+        # calculate grid indices and weights for linear splines
+        weights = pyTMD.interpolate._spline_weights(xi, yi, x, y)
+        # use bivariate splines to interpolate values
+        D = pyTMD.interpolate.spline_many(xi, yi, bathymetry, x, y,
+            reducer=np.ceil, weights=weights, kx=1, ky=1)
     else:
         # use scipy regular grid to interpolate values for a given method
         D = pyTMD.interpolate.regulargrid(xi, yi, bathymetry, x, y,
@@ -388,7 +469,7 @@ def extract_constants(
 
     # u and v: velocities in cm/s
     if kwargs['type'] in ('v','u'):
-        unit_conv = (D/100.0)
+        unit_conv = (D[:,None]/100.0)
     # h is elevation values in m
     # U and V are transports in m^2/s
     elif kwargs['type'] in ('z','V','U'):
@@ -407,8 +488,24 @@ def extract_constants(
     amplitude.mask = np.zeros((npts,nc), dtype=bool)
     ph = np.ma.zeros((npts,nc))
     ph.mask = np.zeros((npts,nc), dtype=bool)
-    # read and interpolate each constituent
-    for i,c in enumerate(constituents):
+    # interpolate global constituents with periodic grid indices
+    # rather than extending each constituent matrix
+    periodic = is_global and (kwargs['method'] == 'spline')
+    if periodic:
+        # columns of the model grid before extension
+        gx = slice(1, -1)
+        weights = [(jj, (ii - 1) % (len(xi) - 2), w)
+            for jj, ii, w in weights]
+    else:
+        gx = slice(None)
+    # open TMD3 netCDF4 file once for reading all constituents
+    if (kwargs['grid'] == 'TMD3'):
+        fileID = netCDF4.Dataset(pathlib.Path(model_file).expanduser(), 'r')
+    # KD-trees of valid model points for extrapolation
+    trees = []
+
+    # read and interpolate a single constituent
+    def _interpolate_constituent(i: int, c: str):
         if (kwargs['type'] == 'z'):
             # read z constituent from elevation file
             if (kwargs['grid'] == 'ATLAS'):
@@ -416,7 +513,7 @@ def extract_constants(
                 _,_,hc = combine_atlas_model(x0, y0, z0, pmask, zlocal,
                     variable='z')
             elif (kwargs['grid'] == 'TMD3'):
-                hc = read_netcdf_file(model_file, i, variable='z')
+                hc = read_netcdf_file(fileID, i, variable='z')
                 # apply flexure scaling
                 if kwargs['apply_flexure']:
                     hc *= sf
@@ -431,7 +528,7 @@ def extract_constants(
                 _,_,hc = combine_atlas_model(x0, y0, u0, pmask, uvlocal,
                     variable='u')
             elif (kwargs['grid'] == 'TMD3'):
-                hc = read_netcdf_file(model_file, i, variable='u')
+                hc = read_netcdf_file(fileID, i, variable='u')
             elif isinstance(model_file,list):
                 hc,v = read_otis_transport(model_file[i], 0)
             else:
@@ -443,7 +540,7 @@ def extract_constants(
                 _,_,hc = combine_atlas_model(x0, y0, v0, pmask, uvlocal,
                     variable='v')
             elif (kwargs['grid'] == 'TMD3'):
-                hc = read_netcdf_file(model_file, i, variable='v')
+                hc = read_netcdf_file(fileID, i, variable='v')
             elif isinstance(model_file,list):
                 u,hc = read_otis_transport(model_file[i], 0)
             else:
@@ -451,30 +548,34 @@ def extract_constants(
 
         # crop tide model data to (buffered) bounds
         if kwargs['crop'] and np.any(bounds):
-            hc, _, _ = _crop(hc, mx, my,
-                bounds=bounds, buffer=buffer,
-                is_geographic=is_geographic)
+            hc = hc[rows, cols]
         # replace original values with extend matrices
-        if is_global:
+        if is_global and not periodic:
             hc = _extend_matrix(hc)
         # copy mask to constituent
-        hc.mask |= bathymetry.mask
+        # linear spline values are masked with the interpolated bathymetry
+        # which avoids updating the full grid for few output points
+        if (kwargs['method'] != 'spline') or kwargs['extrapolate']:
+            hc.mask |= bathymetry.mask[:,gx]
 
         # interpolate amplitude and phase of the constituent
         if (kwargs['method'] == 'bilinear'):
-            # replace zero values with nan
-            hc.data[(hc==0) | hc.mask] = np.nan
+            # replace zero and masked values with nan
+            nodata = np.equal(hc.data, 0)
+            nodata |= hc.mask
+            hc.data[nodata] = np.nan
             # use quick bilinear to interpolate values
             hci = pyTMD.interpolate.bilinear(xi, yi, hc, x, y,
-                dtype=hc.dtype)
+                dtype=hc.dtype, weights=weights)
             # replace nan values with fill_value
             hci.mask = (np.isnan(hci.data) | D.mask)
             hci.data[hci.mask] = hci.fill_value
         elif (kwargs['method'] == 'spline'):
-            # use scipy bivariate splines to interpolate values
-            hci = pyTMD.interpolate.spline(xi, yi, hc, x, y,
+            # use bivariate splines to interpolate values
+            hci = pyTMD.interpolate.spline_many(xi, yi, hc, x, y,
                 dtype=hc.dtype,
                 reducer=np.ceil,
+                weights=weights,
                 kx=1, ky=1)
             # replace zero values with fill_value
             hci.mask |= D.mask
@@ -488,32 +589,65 @@ def extract_constants(
                 reducer=np.ceil,
                 bounds_error=False)
             # replace invalid values with fill_value
-            hci.mask = (hci.data == hci.fill_value) | D.mask
+            hci.mask = np.equal(hci.data, hci.fill_value)
+            hci.mask |= D.mask
             hci.data[hci.mask] = hci.fill_value
         # extrapolate data using nearest-neighbors
         if kwargs['extrapolate'] and np.any(hci.mask):
             # find invalid data points
             inv, = np.nonzero(hci.mask)
-            # replace zero values with nan
-            hc.data[(hc==0) | hc.mask] = np.nan
+            # replace zero and masked values with nan
+            # values were already replaced for bilinear interpolation
+            if (kwargs['method'] != 'bilinear'):
+                nodata = np.equal(hc.data, 0)
+                nodata |= hc.mask
+                hc.data[nodata] = np.nan
+            # find or calculate KD-tree of valid model points
+            tree = _extrapolate_tree(trees, xi[gx], yi, hc,
+                x[inv], y[inv], cutoff=kwargs['cutoff'],
+                is_geographic=is_geographic)
             # extrapolate points within cutoff of valid model points
-            hci[inv] = pyTMD.interpolate.extrapolate(xi, yi, hc,
+            hci[inv] = pyTMD.interpolate.extrapolate(xi[gx], yi, hc,
                 x[inv], y[inv], dtype=hc.dtype,
                 cutoff=kwargs['cutoff'],
-                is_geographic=is_geographic)
-        # convert units
-        # amplitude and phase of the constituent
-        amplitude.data[:,i] = np.abs(hci.data)/unit_conv
-        amplitude.mask[:,i] = np.copy(hci.mask)
-        ph.data[:,i] = np.arctan2(-np.imag(hci), np.real(hci))
-        ph.mask[:,i] = np.copy(hci.mask)
-        # update mask to invalidate points outside model domain
-        ph.mask[:,i] |= invalid
-        amplitude.mask[:,i] |= invalid
+                is_geographic=is_geographic,
+                tree=tree)
+        # return the interpolated constituent
+        return hci
 
-    # convert phase to degrees
-    phase = ph*180.0/np.pi
-    phase.data[phase.data < 0] += 360.0
+    # read and interpolate each constituent
+    # constituents are read one at a time by default to limit memory usage
+    # OTIS constituents can optionally be processed in parallel threads
+    # with one constituent held in memory for each thread
+    # ATLAS and TMD3 constituents are processed serially
+    threads = min(nc, kwargs['threads'])
+    if (threads > 1) and (kwargs['grid'] == 'OTIS'):
+        with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+            HC = list(executor.map(_interpolate_constituent,
+                range(nc), constituents))
+    else:
+        HC = [_interpolate_constituent(i, c)
+            for i, c in enumerate(constituents)]
+    # close the TMD3 netCDF4 file
+    if (kwargs['grid'] == 'TMD3'):
+        fileID.close()
+
+    # stack the interpolated constituents to (npts, nc)
+    hci = np.ma.stack(HC, axis=1)
+    # convert units
+    # amplitude and phase of the constituents
+    amplitude.data[:] = np.abs(hci.data)/unit_conv
+    # phase is the negative of the complex angle
+    np.arctan2(hci.data.imag, hci.data.real, out=ph.data)
+    np.negative(ph.data, out=ph.data)
+    # update mask to invalidate points outside model domain
+    amplitude.mask[:] = np.ma.getmaskarray(hci) | invalid[:,None]
+    ph.mask[:] = amplitude.mask
+
+    # convert phase to degrees and wrap to 0:360 in place
+    phase = ph
+    np.degrees(phase.data, out=phase.data)
+    np.mod(phase.data, 360.0, out=phase.data)
     # replace data for invalid mask values
     amplitude.data[amplitude.mask] = amplitude.fill_value
     phase.data[phase.mask] = phase.fill_value
@@ -560,6 +694,8 @@ def read_constants(
         Buffer angle or distance for cropping tide model data
     apply_flexure: bool, default False
         Apply ice flexure scaling factor to height values
+    threads: int, default from ``PYTMD_NTHREADS`` or 1
+        Maximum number of threads for reading OTIS constituents
 
     Returns
     -------
@@ -573,6 +709,7 @@ def read_constants(
     kwargs.setdefault('bounds', None)
     kwargs.setdefault('buffer', 0)
     kwargs.setdefault('apply_flexure', False)
+    kwargs.setdefault('threads', _default_threads())
 
     # check that grid file is accessible
     grid_file = pathlib.Path(grid_file).expanduser()
@@ -598,20 +735,19 @@ def read_constants(
     dy = yi[1] - yi[0]
 
     # run wrapper function to convert coordinate systems
-    # crs = pyTMD.crs().get(projection) # original code with error
-    crs = pyTMD.crs.crs().get(projection) # Hung, 28 Feb 25
+    crs = pyTMD.crs().get(projection)
     # if global: extend limits
     is_geographic = crs.is_geographic
 
     # crop mask and bathymetry data to (buffered) bounds
     # or adjust longitudinal convention to fit tide model
     if kwargs['crop'] and np.any(kwargs['bounds']):
-        # crop tide model data
-        mx, my = np.copy(xi), np.copy(yi)
-        mz, xi, yi = _crop(mz, mx, my, bounds=kwargs['bounds'],
-            buffer=kwargs['buffer'], is_geographic=is_geographic)
-        hz, xi, yi = _crop(hz, mx, my, bounds=kwargs['bounds'],
-            buffer=kwargs['buffer'], is_geographic=is_geographic)
+        # calculate indices for cropping tide model data
+        rows, cols, xi, yi = _crop_indices(xi, yi,
+            bounds=kwargs['bounds'], buffer=kwargs['buffer'],
+            is_geographic=is_geographic)
+        mz = mz[rows, cols]
+        hz = hz[rows, cols]
 
     # replace original values with extend arrays/matrices
     is_global = False
@@ -633,7 +769,7 @@ def read_constants(
     elif kwargs['type'] in ('u','U'):
         # interpolate masks and bathymetry to u, v nodes
         mu,mv = _mask_nodes(hz, is_global=is_global)
-        hu,hv = _interpolate_zeta(hz, is_global=is_global)
+        hu,hv = _interpolate_zeta(hz, is_global=is_global, mu=mu, mv=mv)
         # invert current masks to be True for invalid points
         mu = np.logical_not(mu).astype(mu.dtype)
         # replace original values with extend matrices
@@ -648,7 +784,7 @@ def read_constants(
     elif kwargs['type'] in ('v','V'):
         # interpolate masks and bathymetry to u, v nodes
         mu,mv = _mask_nodes(hz, is_global=is_global)
-        hu,hv = _interpolate_zeta(hz, is_global=is_global)
+        hu,hv = _interpolate_zeta(hz, is_global=is_global, mu=mu, mv=mv)
         # invert current masks to be True for invalid points
         mv = np.logical_not(mv).astype(mv.dtype)
         # replace original values with extend matrices
@@ -675,8 +811,29 @@ def read_constants(
         bathymetry=bathymetry.data, mask=mask, crs=crs,
         longitude=lon, latitude=lat)
 
-    # read each model constituent
-    for i,c in enumerate(cons):
+    # read all constituents from a single OTIS elevation file
+    if (kwargs['type'] == 'z') and (kwargs['grid'] == 'OTIS') and \
+        not isinstance(model_file, list):
+        hc = read_otis_elevation_stack(model_file)
+        # crop tide model data to (buffered) bounds
+        if kwargs['crop'] and np.any(kwargs['bounds']):
+            hc = hc[:, rows, cols]
+        # replace original values with extend matrices
+        if is_global:
+            hc = _extend_matrix(hc)
+        # copy mask to all constituents
+        hc.mask |= bathymetry.mask
+        # append each constituent as a view of the combined array
+        for i,c in enumerate(cons):
+            constituents.append(c, hc[i])
+        # return the complex form of the model constituents
+        return constituents
+
+    # open TMD3 netCDF4 file once for reading all constituents
+    if (kwargs['grid'] == 'TMD3'):
+        fileID = netCDF4.Dataset(pathlib.Path(model_file).expanduser(), 'r')
+    # read, crop and extend a model constituent
+    def _read_constituent(i, c):
         if (kwargs['type'] == 'z'):
             # read constituent from elevation file
             if (kwargs['grid'] == 'ATLAS'):
@@ -684,7 +841,7 @@ def read_constants(
                 _,_,hc = combine_atlas_model(x0, y0, z0, pmask, zlocal,
                     variable='z')
             elif (kwargs['grid'] == 'TMD3'):
-                hc = read_netcdf_file(model_file, i, variable='z')
+                hc = read_netcdf_file(fileID, i, variable='z')
                 # apply flexure scaling
                 if kwargs['apply_flexure']:
                     hc *= sf
@@ -699,7 +856,7 @@ def read_constants(
                 _,_,hc = combine_atlas_model(x0, y0, u0, pmask, uvlocal,
                     variable='u')
             elif (kwargs['grid'] == 'TMD3'):
-                hc = read_netcdf_file(model_file, i, variable='u')
+                hc = read_netcdf_file(fileID, i, variable='u')
             elif isinstance(model_file,list):
                 hc,v = read_otis_transport(model_file[i], 0)
             else:
@@ -711,7 +868,7 @@ def read_constants(
                 _,_,hc = combine_atlas_model(x0, y0, v0, pmask, uvlocal,
                     variable='v')
             elif (kwargs['grid'] == 'TMD3'):
-                hc = read_netcdf_file(model_file, i, variable='v')
+                hc = read_netcdf_file(fileID, i, variable='v')
             elif isinstance(model_file,list):
                 u,hc = read_otis_transport(model_file[i], 0)
             else:
@@ -719,17 +876,30 @@ def read_constants(
 
         # crop tide model data to (buffered) bounds
         if kwargs['crop'] and np.any(kwargs['bounds']):
-            hc, _, _ = _crop(hc, mx, my,
-                bounds=kwargs['bounds'],
-                buffer=kwargs['buffer'],
-                is_geographic=is_geographic)
+            hc = hc[rows, cols]
         # replace original values with extend matrices
         if is_global:
             hc = _extend_matrix(hc)
         # copy mask to constituent
         hc.mask |= bathymetry.mask
-        # append extended constituent
+        # return the extended constituent
+        return hc
+
+    # read each model constituent
+    # OTIS constituents can be read in parallel threads
+    # ATLAS and TMD3 constituents are read serially
+    threads = min(len(cons), kwargs['threads'])
+    if (threads > 1) and (kwargs['grid'] == 'OTIS'):
+        with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+            HC = list(executor.map(_read_constituent, range(len(cons)), cons))
+    else:
+        HC = [_read_constituent(i, c) for i, c in enumerate(cons)]
+    # append extended constituents in order
+    for c, hc in zip(cons, HC):
         constituents.append(c, hc)
+    # close the TMD3 netCDF4 file
+    if (kwargs['grid'] == 'TMD3'):
+        fileID.close()
 
     # return the complex form of the model constituents
     return constituents
@@ -767,7 +937,7 @@ def interpolate_constants(
         Interpolation method
 
             - ``'bilinear'``: quick bilinear interpolation
-            - ``'spline'``: scipy bivariate spline interpolation
+            - ``'spline'``: linear bivariate spline interpolation
             - ``'linear'``, ``'nearest'``: scipy regular grid interpolations
     extrapolate: bool, default False
         Extrapolate model using nearest-neighbors
@@ -792,35 +962,47 @@ def interpolate_constants(
     # verify that constituents are valid class instance
     assert isinstance(constituents, pyTMD.io.constituents)
     # extract model coordinates
-    xi = np.copy(constituents.x)
-    yi = np.copy(constituents.y)
+    xi = constituents.x
+    yi = constituents.y
 
     # adjust dimensions of input coordinates to be iterable
-    ilon = np.atleast_1d(np.copy(ilon))
-    ilat = np.atleast_1d(np.copy(ilat))
+    # transformed coordinates are new arrays so inputs are not copied
+    ilon = np.atleast_1d(ilon)
+    ilat = np.atleast_1d(ilat)
     # convert coordinate systems of input lat/lon
     x,y = constituents.crs.transform(ilon, ilat)
     is_geographic = constituents.crs.is_geographic
     # adjust longitudinal convention of input latitude and longitude
     # to fit tide model convention
-    if (np.min(x) < np.min(xi)) & is_geographic:
-        x[x < 0] += 360.0
-    if (np.max(x) > np.max(xi)) & is_geographic:
-        x[x > 180] -= 360.0
+    if is_geographic:
+        np.subtract(x, xi[0], out=x)
+        np.mod(x, 360.0, out=x)
+        np.add(x, xi[0], out=x)
     # determine if any input points are outside of the model bounds
-    invalid = (x < xi.min()) | (x > xi.max()) | (y < yi.min()) | (y > yi.max())
+    # model grid coordinates are uniform and sorted
+    # accumulate the bounds checks into a single boolean array
+    invalid = np.less(x, xi[0])
+    invalid |= np.greater(x, xi[-1])
+    invalid |= np.less(y, yi[0])
+    invalid |= np.greater(y, yi[-1])
 
     # input model bathymetry
+    # setting the mask copies the values into a new mask array
     bathymetry = np.ma.array(constituents.bathymetry)
-    bathymetry.mask = np.copy(constituents.mask)
+    bathymetry.mask = constituents.mask
     # interpolate depth and mask to output points
     if (kwargs['method'] == 'bilinear'):
+        # calculate grid indices and weights for bilinear interpolation
+        weights = pyTMD.interpolate._bilinear_weights(xi, yi, x, y)
         # use quick bilinear to interpolate values
-        D = pyTMD.interpolate.bilinear(xi, yi, bathymetry, x, y)
+        D = pyTMD.interpolate.bilinear(xi, yi, bathymetry, x, y,
+            weights=weights)
     elif (kwargs['method'] == 'spline'):
-        # use scipy bivariate splines to interpolate values
-        D = pyTMD.interpolate.spline(xi, yi, bathymetry, x, y,
-            reducer=np.ceil, kx=1, ky=1)
+        # calculate grid indices and weights for linear splines
+        weights = pyTMD.interpolate._spline_weights(xi, yi, x, y)
+        # use bivariate splines to interpolate values
+        D = pyTMD.interpolate.spline_many(xi, yi, bathymetry, x, y,
+            reducer=np.ceil, weights=weights, kx=1, ky=1)
     else:
         # use scipy regular grid to interpolate values for a given method
         D = pyTMD.interpolate.regulargrid(xi, yi, bathymetry, x, y,
@@ -828,7 +1010,7 @@ def interpolate_constants(
 
     # u and v: velocities in cm/s
     if kwargs['type'] in ('v','u'):
-        unit_conv = (D/100.0)
+        unit_conv = (D[:,None]/100.0)
     # h is elevation values in m
     # U and V are transports in m^2/s
     elif kwargs['type'] in ('z','V','U'):
@@ -838,73 +1020,99 @@ def interpolate_constants(
     nc = len(constituents)
     # number of output data points
     npts = len(D)
-    amplitude = np.ma.zeros((npts,nc))
-    amplitude.mask = np.zeros((npts,nc), dtype=bool)
-    ph = np.ma.zeros((npts,nc))
-    ph.mask = np.zeros((npts,nc), dtype=bool)
     # default complex fill value
     fill_value = np.ma.default_fill_value(np.dtype(complex))
+    # scratch buffer for regular grid interpolation
+    scratch = None
+    # KD-trees of valid model points for extrapolation
+    trees = []
+    # interpolated constituents
+    HC = []
     # interpolate each constituent
+    # model constituents are not modified and invalid values
+    # are only replaced in the output amplitude and phase
     for i, c in enumerate(constituents.fields):
         # get model constituent
         hc = constituents.get(c)
+        # find zero and masked values
+        nodata = np.equal(hc.data, 0)
+        nodata |= hc.mask
         # interpolate amplitude and phase of the constituent
         if (kwargs['method'] == 'bilinear'):
-            # replace zero values with nan
-            hc.data[(hc.data == 0) | hc.mask] = np.nan
-            # use quick bilinear to interpolate values
-            hci = pyTMD.interpolate.bilinear(xi, yi, hc, x, y,
-                dtype=hc.dtype)
-            # replace nan values with fill_value
-            hci.mask = np.isnan(hci.data) | D.mask
-            hci.data[hci.mask] = hci.fill_value
+            # use quick bilinear to interpolate valid values
+            hci = pyTMD.interpolate.bilinear(xi, yi,
+                np.ma.array(hc.data, mask=nodata), x, y,
+                dtype=hc.dtype, weights=weights)
+            # update mask for nan values
+            hci.mask |= np.isnan(hci.data)
+            hci.mask |= D.mask
         elif (kwargs['method'] == 'spline'):
-            # replace zero values with fill value
-            hci = pyTMD.interpolate.spline(xi, yi, hc, x, y,
+            # use linear splines to interpolate values
+            hci = pyTMD.interpolate.spline_many(xi, yi, hc, x, y,
                 fill_value=fill_value,
                 dtype=hc.dtype,
                 reducer=np.ceil,
+                weights=weights,
                 kx=1, ky=1)
-            # replace zero values with fill_value
+            # use mask from interpolated bathymetry
             hci.mask = D.mask
-            hci.data[hci.mask] = hci.fill_value
         else:
-            # replace zero values with fill value
-            hc.data[(hc.data == 0) | hc.mask] = fill_value
+            # replace zero and masked values with fill value
+            # in a scratch copy of the constituent
+            if scratch is None:
+                scratch = np.empty_like(hc.data)
+            np.copyto(scratch, hc.data)
+            scratch[nodata] = fill_value
             # use scipy regular grid to interpolate values
-            hci = pyTMD.interpolate.regulargrid(xi, yi, hc, x, y,
+            hci = pyTMD.interpolate.regulargrid(xi, yi,
+                np.ma.array(scratch, mask=hc.mask), x, y,
                 fill_value=fill_value,
                 dtype=hc.dtype,
                 method=kwargs['method'],
                 reducer=np.ceil,
                 bounds_error=False)
-            # replace invalid values with fill_value
-            hci.mask = (hci.data == hci.fill_value) | D.mask
-            hci.data[hci.mask] = hci.fill_value
+            # find invalid values
+            hci.mask = np.equal(hci.data, hci.fill_value)
+            hci.mask |= D.mask
         # extrapolate data using nearest-neighbors
         if kwargs['extrapolate'] and np.any(hci.mask):
             # find invalid data points
             inv, = np.nonzero(hci.mask)
-            # replace zero values with nan
-            hc.data[(hc==0) | hc.mask] = np.nan
+            # constituent with zero and masked values invalidated
+            hcn = np.ma.array(hc.data, mask=nodata, fill_value=hc.fill_value)
+            # find or calculate KD-tree of valid model points
+            tree = _extrapolate_tree(trees, xi, yi, hcn,
+                x[inv], y[inv], cutoff=kwargs['cutoff'],
+                is_geographic=is_geographic)
             # extrapolate points within cutoff of valid model points
-            hci[inv] = pyTMD.interpolate.extrapolate(xi, yi, hc,
+            hci[inv] = pyTMD.interpolate.extrapolate(xi, yi, hcn,
                 x[inv], y[inv], dtype=hc.dtype,
                 cutoff=kwargs['cutoff'],
-                is_geographic=is_geographic)
-        # convert units
-        # amplitude and phase of the constituent
-        amplitude.data[:,i] = np.abs(hci.data)/unit_conv
-        amplitude.mask[:,i] = np.copy(hci.mask)
-        ph.data[:,i] = np.arctan2(-np.imag(hci), np.real(hci))
-        ph.mask[:,i] = np.copy(hci.mask)
-        # update mask to invalidate points outside model domain
-        ph.mask[:,i] |= invalid
-        amplitude.mask[:,i] |= invalid
+                is_geographic=is_geographic,
+                tree=tree)
+        # save the interpolated constituent
+        HC.append(hci)
+
+    # stack the interpolated constituents to (npts, nc)
+    hci = np.ma.stack(HC, axis=1)
+    # convert units
+    # amplitude and phase of the constituents as plain arrays
+    amp = np.zeros((npts,nc))
+    amp[:] = np.abs(hci.data)/unit_conv
+    # phase is the negative of the complex angle
+    ph = np.zeros((npts,nc))
+    np.arctan2(hci.data.imag, hci.data.real, out=ph)
+    np.negative(ph, out=ph)
+    # invalidate masked points and points outside model domain
+    mask = np.ma.getmaskarray(hci) | invalid[:,None]
 
     # convert phase to degrees
-    phase = ph*180.0/np.pi
-    phase.data[phase.data < 0] += 360.0
+    ph *= 180.0
+    ph /= np.pi
+    ph[ph < 0] += 360.0
+    # create masked arrays of the amplitude and phase
+    amplitude = np.ma.array(amp, mask=mask)
+    phase = np.ma.array(ph, mask=mask.copy())
     # replace data for invalid mask values
     amplitude.data[amplitude.mask] = amplitude.fill_value
     phase.data[phase.mask] = phase.fill_value
@@ -965,11 +1173,11 @@ def read_otis_grid(input_file: str | pathlib.Path):
         fid.seek(8,1)
         iob=np.fromfile(fid, dtype=np.dtype('>i4'), count=2*nob).reshape(nob, 2)
         fid.seek(8,1)
-    # read hz matrix
-    hz = np.fromfile(fid, dtype=np.dtype('>f4'), count=nx*ny).reshape(ny, nx)
-    fid.seek(8,1)
-    # read mz matrix
-    mz = np.fromfile(fid, dtype=np.dtype('>i4'), count=nx*ny).reshape(ny, nx)
+    # read hz and mz matrices and the record padding between them
+    dtype = np.dtype([('hz', '>f4', (ny, nx)), ('pad', '>i4', (2,)),
+        ('mz', '>i4', (ny, nx))])
+    record, = np.fromfile(fid, dtype=dtype, count=1)
+    hz, mz = record['hz'], record['mz']
     # close the file
     fid.close()
     # return values
@@ -1034,45 +1242,51 @@ def read_atlas_grid(input_file: str | pathlib.Path):
         fid.seek(8,1)
         iob=np.fromfile(fid, dtype=np.dtype('>i4'), count=2*nob).reshape(nob, 2)
         fid.seek(8,1)
-    # read hz matrix
-    hz = np.fromfile(fid, dtype=np.dtype('>f4'), count=nx*ny).reshape(ny, nx)
-    fid.seek(8,1)
-    # read mz matrix
-    mz = np.fromfile(fid, dtype=np.dtype('>i4'), count=nx*ny).reshape(ny, nx)
-    fid.seek(8,1)
-    # read pmask matrix
-    pmask = np.fromfile(fid, dtype=np.dtype('>i4'), count=nx*ny).reshape(ny, nx)
+    # read hz, mz and pmask matrices and the record padding between them
+    dtype = np.dtype([('hz', '>f4', (ny, nx)), ('pad1', '>i4', (2,)),
+        ('mz', '>i4', (ny, nx)), ('pad2', '>i4', (2,)),
+        ('pmask', '>i4', (ny, nx))])
+    record, = np.fromfile(fid, dtype=dtype, count=1)
+    hz, mz, pmask = record['hz'], record['mz'], record['pmask']
     fid.seek(4,1)
+    # read the local models from the remainder of the file
+    buffer = fid.read(file_info.st_size - fid.tell())
+    # close the file
+    fid.close()
     # read local models
     nmod = 0
     local = {}
-    # while the file position is not at the end of file
-    while (fid.tell() < file_info.st_size):
+    position = 0
+    # while the buffer position is not at the end of file
+    while (position < len(buffer)):
         # add 1 to number of models
-        fid.seek(4,1)
         nmod += 1
         # get local model dimensions and limits
-        nx1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        ny1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        nd, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
+        nx1,ny1,nd = np.frombuffer(buffer, dtype=np.dtype('>i4'),
+            count=3, offset=position+4)
+        nd = int(nd)
         # extract latitude and longitude limits of local model
-        lt1 = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-        ln1 = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
+        lt1 = np.frombuffer(buffer, dtype=np.dtype('>f4'),
+            count=2, offset=position+16).copy()
+        ln1 = np.frombuffer(buffer, dtype=np.dtype('>f4'),
+            count=2, offset=position+24).copy()
         # extract name
-        name = fid.read(20).strip()
-        fid.seek(8,1)
-        iz = np.fromfile(fid, dtype=np.dtype('>i4'), count=nd)
-        jz = np.fromfile(fid, dtype=np.dtype('>i4'), count=nd)
-        fid.seek(8,1)
+        name = buffer[position+32:position+52].strip()
+        position += 60
+        # zero-based indices of valid local model points
+        iz = np.frombuffer(buffer, dtype=np.dtype('>i4'),
+            count=nd, offset=position) - 1
+        jz = np.frombuffer(buffer, dtype=np.dtype('>i4'),
+            count=nd, offset=position+4*nd) - 1
+        position += 8*nd + 8
         depth = np.ma.zeros((ny1,nx1))
         depth.mask = np.ones((ny1,nx1), dtype=bool)
-        depth.data[jz-1,iz-1] = np.fromfile(fid, dtype=np.dtype('>f4'), count=nd)
-        depth.mask[jz-1,iz-1] = False
-        fid.seek(4,1)
+        depth.data[jz,iz] = np.frombuffer(buffer, dtype=np.dtype('>f4'),
+            count=nd, offset=position)
+        depth.mask[jz,iz] = False
+        position += 4*nd + 4
         # save to dictionary
         local[name] = dict(lon=ln1, lat=lt1, depth=depth)
-    # close the file
-    fid.close()
     # return values
     return (x, y, hz, mz, iob, dt, pmask, local)
 
@@ -1106,13 +1320,13 @@ def read_netcdf_grid(input_file: str | pathlib.Path):
     fileID = netCDF4.Dataset(input_file, 'r')
     # read coordinates and flip y orientation
     x = fileID.variables['x'][:].copy()
-    y = fileID.variables['y'][::-1].copy()
+    y = fileID.variables['y'][:][::-1].copy()
     # read water column thickness and flip y orientation
-    hz = fileID.variables['wct'][::-1,:].copy()
+    hz = fileID.variables['wct'][:,:][::-1,:].copy()
     # read mask and flip y orientation
-    mz = fileID.variables['mask'][::-1,:].copy()
+    mz = fileID.variables['mask'][:,:][::-1,:].copy()
     # read flexure and convert from percent to scale factor
-    sf = fileID.variables['flexure'][::-1,:]/100.0
+    sf = fileID.variables['flexure'][:,:][::-1,:]/100.0
     # update bathymetry and scale factor masks
     hz.mask = (hz.data == 0.0)
     sf.mask = (sf.data == 0.0)
@@ -1165,7 +1379,7 @@ def read_constituents(
         ll, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
         nx,ny,nc = np.fromfile(fid, dtype=np.dtype('>i4'), count=3)
         fid.seek(16,1)
-        constituents = [c.decode("utf8").rstrip() for c in fid.read(nc*4).split()]
+        constituents = fid.read(nc*4).decode("utf8").split()
         fid.close()
     return (constituents, nc)
 
@@ -1198,22 +1412,64 @@ def read_otis_elevation(
     # extract x and y limits
     ylim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
     xlim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-    # skip records to constituent
-    nskip = ic*(int(nx)*int(ny)*8 + 8) + 8 + int(ll) - 28
-    fid.seek(nskip,1)
+    # close the file
+    fid.close()
+    # offset of the record for the constituent
+    offset = ic*(int(nx)*int(ny)*8 + 8) + int(ll) + 12
+    # memory-map the constituent record
+    temp = np.memmap(input_file, dtype=np.dtype('>c8'), mode='r',
+        offset=offset, shape=(ny, nx))
     # real and imaginary components of elevation
     h = np.ma.zeros((ny, nx), dtype=np.complex64)
     h.mask = np.zeros((ny, nx), dtype=bool)
-    for i in range(ny):
-        temp = np.fromfile(fid, dtype=np.dtype('>f4'), count=2*nx)
-        h.data.real[i,:] = temp[0:2*nx-1:2]
-        h.data.imag[i,:] = temp[1:2*nx:2]
+    h.data[:] = temp
     # update mask for nan values
     h.mask[np.isnan(h.data)] = True
     # replace masked values with fill value
     h.data[h.mask] = h.fill_value
+    # return the elevation
+    return h
+
+# PURPOSE: read elevation file to extract real and imaginary components
+# for all constituents
+def read_otis_elevation_stack(input_file: str | pathlib.Path):
+    """
+    Read elevation file to extract real and imaginary components for
+    all constituents
+
+    Parameters
+    ----------
+    input_file: str or pathlib.Path
+        input elevation file
+
+    Returns
+    -------
+    h: np.ndarray
+        tidal elevation with constituents in the first dimension
+    """
+    # open the input file
+    input_file = pathlib.Path(input_file).expanduser()
+    fid = input_file.open(mode='rb')
+    ll, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
+    nx,ny,nc = np.fromfile(fid, dtype=np.dtype('>i4'), count=3)
+    # extract x and y limits
+    ylim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
+    xlim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
     # close the file
     fid.close()
+    # memory-map the fixed-length records of real and imaginary
+    # components of elevation for each constituent
+    dtype = np.dtype([('head', '>i4'), ('h', '>c8', (ny, nx)),
+        ('tail', '>i4')])
+    records = np.memmap(input_file, dtype=dtype, mode='r',
+        offset=int(ll) + 8, shape=(nc,))
+    # real and imaginary components of elevation
+    h = np.ma.zeros((nc, ny, nx), dtype=np.complex64)
+    h.data[:] = records['h']
+    # update mask for nan values
+    h.mask = np.isnan(h.data)
+    # replace masked values with fill value
+    h.data[h.mask] = h.fill_value
     # return the elevation
     return h
 
@@ -1246,73 +1502,37 @@ def read_atlas_elevation(
 
             - ``'z'``: tidal elevation
     """
-    # open the input file and get file information
+    # parse the file structure (cached for repeated calls)
     input_file = pathlib.Path(input_file).expanduser()
-    file_info = input_file.stat()
+    index = _read_atlas_index(str(input_file.resolve()),
+        input_file.stat().st_mtime_ns, variable='z')
+    nx, ny = index['nx'], index['ny']
     fid = input_file.open(mode='rb')
-    ll, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-    nx,ny,nc = np.fromfile(fid, dtype=np.dtype('>i4'), count=3)
-    # extract x and y limits
-    ylim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-    xlim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-    # skip records to constituent
-    nskip = 8 + int(nc)*4 + int(ic)*(int(nx)*int(ny)*8 + 8)
-    fid.seek(nskip,1)
-    # real and imaginary components of elevation
+    # read the real and imaginary components of elevation
+    fid.seek(index['offset'] + ic*(nx*ny*8 + 8))
     h = np.ma.zeros((ny, nx), dtype=np.complex64)
     h.mask = np.zeros((ny, nx), dtype=bool)
-    for i in range(ny):
-        temp = np.fromfile(fid, dtype=np.dtype('>f4'), count=2*nx)
-        h.data.real[i,:] = temp[0:2*nx-1:2]
-        h.data.imag[i,:] = temp[1:2*nx:2]
-    # skip records after constituent
-    nskip = (int(nc) - int(ic) - 1)*(int(nx)*int(ny)*8 + 8) + 4
-    fid.seek(nskip,1)
-    # read local models to find constituent
-    nmod = 0
+    temp = np.fromfile(fid, dtype=np.dtype('>c8'), count=nx*ny)
+    h.data[:] = temp.reshape(ny, nx)
+    # read local models with the constituent
     local = {}
-    # while the file position is not at the end of file
-    while (fid.tell() < file_info.st_size):
-        # add 1 to number of models
-        fid.seek(4,1)
-        nmod += 1
-        # get local model dimensions and limits
-        nx1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        ny1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        nc1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        nz, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        # extract latitude and longitude limits of local model
-        lt1 = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-        ln1 = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-        # extract constituents for localized solution
-        cons = fid.read(nc1*4).strip().decode("utf8").split()
+    for model in index['local']:
         # check if constituent is in list of localized solutions
-        if (constituent in cons):
-            ic1, = [i for i,c in enumerate(cons) if (c == constituent)]
-            # extract name
-            name = fid.read(20).strip()
-            fid.seek(8,1)
-            iz = np.fromfile(fid, dtype=np.dtype('>i4'), count=nz)
-            jz = np.fromfile(fid, dtype=np.dtype('>i4'), count=nz)
-            # skip records to constituent
-            nskip = 8 + int(ic1)*(8*int(nz) + 8)
-            fid.seek(nskip,1)
-            # real and imaginary components of elevation
-            h1 = np.ma.zeros((ny1,nx1), fill_value=np.nan, dtype=np.complex64)
-            h1.mask = np.ones((ny1,nx1), dtype=bool)
-            temp = np.fromfile(fid, dtype=np.dtype('>f4'), count=2*nz)
-            h1.data.real[jz-1,iz-1] = temp[0:2*nz-1:2]
-            h1.data.imag[jz-1,iz-1] = temp[1:2*nz:2]
-            h1.mask[jz-1,iz-1] = False
-            # save constituent to dictionary
-            local[name] = dict(lon=ln1,lat=lt1,z=h1)
-            # skip records after constituent
-            nskip = (int(nc1) - int(ic1) - 1)*(8*int(nz) + 8) + 4
-            fid.seek(nskip,1)
-        else:
-            # skip records for local model if constituent not in list
-            nskip = 40 + 16*int(nz) + (int(nc1) - 1)*(8*int(nz) + 8)
-            fid.seek(nskip,1)
+        if (constituent not in model['constituents']):
+            continue
+        ic1 = model['constituents'].index(constituent)
+        nz = len(model['iz'])
+        jz, iz = model['jz'], model['iz']
+        # real and imaginary components of elevation
+        ny1, nx1 = model['shape']
+        h1 = np.ma.zeros((ny1,nx1), fill_value=np.nan, dtype=np.complex64)
+        h1.mask = np.ones((ny1,nx1), dtype=bool)
+        fid.seek(model['offset'] + ic1*(8*nz + 8))
+        h1.data[jz,iz] = np.fromfile(fid, dtype=np.dtype('>c8'), count=nz)
+        h1.mask[jz,iz] = False
+        # save constituent to dictionary
+        local[model['name']] = dict(lon=model['lon'].copy(),
+            lat=model['lat'].copy(), z=h1)
     # close the file
     fid.close()
     # return the elevation
@@ -1349,28 +1569,28 @@ def read_otis_transport(
     # extract x and y limits
     ylim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
     xlim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-    # skip records to constituent
-    nskip = ic*(int(nx)*int(ny)*16 + 8) + 8 + int(ll) - 28
-    fid.seek(nskip,1)
+    # close the file
+    fid.close()
+    # offset of the record for the constituent
+    offset = ic*(int(nx)*int(ny)*16 + 8) + int(ll) + 12
+    # memory-map the constituent record
+    # with interleaved complex u and v transports at each point
+    dtype = np.dtype([('u', '>c8'), ('v', '>c8')])
+    temp = np.memmap(input_file, dtype=dtype, mode='r',
+        offset=offset, shape=(ny, nx))
     # real and imaginary components of transport
     u = np.ma.zeros((ny, nx), dtype=np.complex64)
     u.mask = np.zeros((ny, nx), dtype=bool)
     v = np.ma.zeros((ny, nx), dtype=np.complex64)
     v.mask = np.zeros((ny, nx), dtype=bool)
-    for i in range(ny):
-        temp = np.fromfile(fid, dtype=np.dtype('>f4'), count=4*nx)
-        u.data.real[i,:] = temp[0:4*nx-3:4]
-        u.data.imag[i,:] = temp[1:4*nx-2:4]
-        v.data.real[i,:] = temp[2:4*nx-1:4]
-        v.data.imag[i,:] = temp[3:4*nx:4]
+    u.data[:] = temp['u']
+    v.data[:] = temp['v']
     # update mask for nan values
     u.mask[np.isnan(u.data)] = True
     v.mask[np.isnan(v.data)] = True
     # replace masked values with fill value
     u.data[u.mask] = u.fill_value
     v.data[v.mask] = v.fill_value
-    # close the file
-    fid.close()
     # return the transport components
     return (u, v)
 
@@ -1406,94 +1626,153 @@ def read_atlas_transport(
             - ``'u'``: zonal tidal transport
             - ``'v'``: meridional zonal transport
     """
-    # open the input file and get file information
+    # parse the file structure (cached for repeated calls)
     input_file = pathlib.Path(input_file).expanduser()
-    file_info = input_file.stat()
+    index = _read_atlas_index(str(input_file.resolve()),
+        input_file.stat().st_mtime_ns, variable='u')
+    nx, ny = index['nx'], index['ny']
     fid = input_file.open(mode='rb')
-    ll, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-    nx,ny,nc = np.fromfile(fid, dtype=np.dtype('>i4'), count=3)
-    # extract x and y limits
-    ylim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-    xlim = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-    # skip records to constituent
-    nskip = 8 + int(nc)*4 + ic*(int(nx)*int(ny)*16 + 8)
-    fid.seek(nskip,1)
-    # real and imaginary components of transport
+    # read the real and imaginary components of transport
+    fid.seek(index['offset'] + ic*(nx*ny*16 + 8))
     u = np.ma.zeros((ny, nx), dtype=np.complex64)
     u.mask = np.zeros((ny, nx), dtype=bool)
     v = np.ma.zeros((ny, nx), dtype=np.complex64)
     v.mask = np.zeros((ny, nx), dtype=bool)
-    for i in range(ny):
-        temp = np.fromfile(fid, dtype=np.dtype('>f4'), count=4*nx)
-        u.data.real[i,:] = temp[0:4*nx-3:4]
-        u.data.imag[i,:] = temp[1:4*nx-2:4]
-        v.data.real[i,:] = temp[2:4*nx-1:4]
-        v.data.imag[i,:] = temp[3:4*nx:4]
-    # skip records after constituent
-    nskip = (int(nc) - int(ic) - 1)*(int(nx)*int(ny)*16 + 8) + 4
-    fid.seek(nskip,1)
-    # read local models to find constituent
-    nmod = 0
+    # interleaved complex u and v transports at each point
+    dtype = np.dtype([('u', '>c8'), ('v', '>c8')])
+    temp = np.fromfile(fid, dtype=dtype, count=nx*ny).reshape(ny, nx)
+    u.data[:] = temp['u']
+    v.data[:] = temp['v']
+    # read local models with the constituent
     local = {}
+    for model in index['local']:
+        # check if constituent is in list of localized solutions
+        if (constituent not in model['constituents']):
+            continue
+        ic1 = model['constituents'].index(constituent)
+        nu, nv = len(model['iu']), len(model['iv'])
+        ju, iu = model['ju'], model['iu']
+        jv, iv = model['jv'], model['iv']
+        ny1, nx1 = model['shape']
+        # real and imaginary components of u transport
+        u1 = np.ma.zeros((ny1,nx1), fill_value=np.nan, dtype=np.complex64)
+        u1.mask = np.ones((ny1,nx1), dtype=bool)
+        fid.seek(model['offset'] + ic1*(8*nu + 8*nv + 16))
+        u1.data[ju,iu] = np.fromfile(fid, dtype=np.dtype('>c8'), count=nu)
+        u1.mask[ju,iu] = False
+        fid.seek(8,1)
+        # real and imaginary components of v transport
+        v1 = np.ma.zeros((ny1,nx1), fill_value=np.nan, dtype=np.complex64)
+        v1.mask = np.ones((ny1,nx1), dtype=bool)
+        v1.data[jv,iv] = np.fromfile(fid, dtype=np.dtype('>c8'), count=nv)
+        v1.mask[jv,iv] = False
+        # save constituent to dictionary
+        local[model['name']] = dict(lon=model['lon'].copy(),
+            lat=model['lat'].copy(), u=u1, v=v1)
+    # close the file
+    fid.close()
+    # return the transport components
+    return (u, v, local)
+
+# PURPOSE: parse the structure of ATLAS elevation and transport files
+@functools.lru_cache(maxsize=8)
+def _read_atlas_index(
+        input_file: str,
+        mtime: int,
+        variable: str = 'z'
+    ):
+    """
+    Parses the global and localized solution records of ATLAS
+    elevation and transport files
+
+    Parameters
+    ----------
+    input_file: str
+        resolved path of the ATLAS elevation or transport file
+    mtime: int
+        modification time of the file in nanoseconds
+    variable: str, default 'z'
+        Tidal variable of the file
+
+            - ``'z'``: heights
+            - ``'u'``: transports
+
+    Returns
+    -------
+    index: dict
+        dimensions and offsets of the global solution with the
+        constituents, valid points and offsets of each localized solution
+
+    Notes
+    -----
+    Returned values are shared between calls and must not be modified
+    """
+    # open the input file and get file information
+    input_file = pathlib.Path(input_file)
+    file_info = input_file.stat()
+    fid = input_file.open(mode='rb')
+    ll, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
+    nx,ny,nc = np.fromfile(fid, dtype=np.dtype('>i4'), count=3)
+    nx,ny,nc = int(nx),int(ny),int(nc)
+    # size of each global constituent record
+    record = nx*ny*(8 if (variable == 'z') else 16) + 8
+    # offset of the first global constituent record
+    offset = 40 + 4*nc
+    # skip the global constituent records
+    fid.seek(offset + nc*record - 4)
+    # read local models
+    local = []
     # while the file position is not at the end of file
     while (fid.tell() < file_info.st_size):
-        # add 1 to number of models
         fid.seek(4,1)
-        nmod += 1
+        model = {}
         # get local model dimensions and limits
-        nx1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        ny1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        nc1, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        nu, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
-        nv, = np.fromfile(fid, dtype=np.dtype('>i4'), count=1)
+        if (variable == 'z'):
+            nx1,ny1,nc1,nz = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=4)
+        else:
+            nx1,ny1,nc1,nu,nv = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=5)
+        model['shape'] = (int(ny1), int(nx1))
         # extract latitude and longitude limits of local model
-        lt1 = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
-        ln1 = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
+        model['lat'] = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
+        model['lon'] = np.fromfile(fid, dtype=np.dtype('>f4'), count=2)
         # extract constituents for localized solution
         cons = fid.read(nc1*4).strip().decode("utf8").split()
-        # check if constituent is in list of localized solutions
-        if (constituent in cons):
-            ic1, = [i for i,c in enumerate(cons) if (c == constituent)]
-            # extract name
-            name = fid.read(20).strip()
-            fid.seek(8,1)
-            iu = np.fromfile(fid, dtype=np.dtype('>i4'), count=nu)
-            ju = np.fromfile(fid, dtype=np.dtype('>i4'), count=nu)
-            fid.seek(8,1)
-            iv = np.fromfile(fid, dtype=np.dtype('>i4'), count=nv)
-            jv = np.fromfile(fid, dtype=np.dtype('>i4'), count=nv)
-            # skip records to constituent
-            nskip = 8 + int(ic1)*(8*int(nu) + 8*int(nv) + 16)
-            fid.seek(nskip,1)
-            # real and imaginary components of u transport
-            u1 = np.ma.zeros((ny1,nx1), fill_value=np.nan, dtype=np.complex64)
-            u1.mask = np.ones((ny1,nx1), dtype=bool)
-            tmpu = np.fromfile(fid, dtype=np.dtype('>f4'), count=2*nu)
-            u1.data.real[ju-1,iu-1] = tmpu[0:2*nu-1:2]
-            u1.data.imag[ju-1,iu-1] = tmpu[1:2*nu:2]
-            u1.mask[ju-1,iu-1] = False
-            fid.seek(8,1)
-            # real and imaginary components of v transport
-            v1 = np.ma.zeros((ny1,nx1), fill_value=np.nan, dtype=np.complex64)
-            v1.mask = np.ones((ny1,nx1), dtype=bool)
-            tmpv = np.fromfile(fid, dtype=np.dtype('>f4'), count=2*nv)
-            v1.data.real[jv-1,iv-1] = tmpv[0:2*nv-1:2]
-            v1.data.imag[jv-1,iv-1] = tmpv[1:2*nv:2]
-            v1.mask[jv-1,iv-1] = False
-            # save constituent to dictionary
-            local[name] = dict(lon=ln1,lat=lt1,u=u1,v=v1)
-            # skip records after constituent
-            nskip = (int(nc1) - int(ic1) - 1)*(8*int(nu) + 8*int(nv) + 16) + 4
-            fid.seek(nskip,1)
+        model['constituents'] = cons
+        # extract name
+        model['name'] = fid.read(20).strip()
+        fid.seek(8,1)
+        if (variable == 'z'):
+            # zero-based indices of valid local model points
+            model['iz'] = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=nz) - 1
+            model['jz'] = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=nz) - 1
+            # size of each local constituent record
+            nrec = 8*int(nz) + 8
         else:
-            # skip records for local model if constituent not in list
-            nskip = 56 + 16*int(nu) + 16*int(nv) + \
-                (int(nc1) - 1)*(8*int(nu) + 8*int(nv) + 16)
-            fid.seek(nskip,1)
+            # zero-based indices of valid local model points
+            model['iu'] = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=nu) - 1
+            model['ju'] = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=nu) - 1
+            fid.seek(8,1)
+            model['iv'] = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=nv) - 1
+            model['jv'] = np.fromfile(fid,
+                dtype=np.dtype('>i4'), count=nv) - 1
+            # size of each local constituent record
+            nrec = 8*int(nu) + 8*int(nv) + 16
+        # offset of the first local constituent record
+        model['offset'] = fid.tell() + 8
+        local.append(model)
+        # skip the local constituent records
+        fid.seek(int(nc1)*nrec + 4, 1)
     # close the file
     fid.close()
-    # return the transport components
-    return (u, v, local)
+    # return the parsed file structure
+    return dict(nx=nx, ny=ny, nc=nc, offset=offset, local=local)
 
 # PURPOSE: create a 2 arc-minute grid mask from mz and depth variables
 def create_atlas_mask(
@@ -1540,31 +1819,19 @@ def create_atlas_mask(
     # interpolate global mask to create initial 2 arc-minute mask
     xcoords=np.clip((len(xi)-1)*(x30-xi[0])/(xi[-1]-xi[0]),0,len(xi)-1)
     ycoords=np.clip((len(yi)-1)*(y30-yi[0])/(yi[-1]-yi[0]),0,len(yi)-1)
-    IY,IX = np.meshgrid(np.around(ycoords), np.around(xcoords), indexing='ij')
+    iy = np.around(ycoords).astype(np.int32)
+    ix = np.around(xcoords).astype(np.int32)
     # interpolate with nearest-neighbors
     m30 = np.ma.zeros((len(y30),len(x30)), dtype=np.int8,fill_value=0)
-    m30.data[:,:] = mz[IY.astype(np.int32), IX.astype(np.int32)]
+    m30.data[:,:] = mz[iy[:,np.newaxis], ix[np.newaxis,:]]
     # iterate over localized solutions to fill in high-resolution coastlines
     for key, val in local.items():
-        # shape of local variable
-        ny, nx = np.shape(val[variable])
-        # correct limits for local grid
-        lon0 = np.floor(val['lon'][0]/d30)*d30
-        lat0 = np.floor(val['lat'][0]/d30)*d30
-        # create latitude and longitude for local model
-        xi = lon0 + np.arange(nx)*d30
-        yi = lat0 + np.arange(ny)*d30
-        IX,IY = np.meshgrid(xi, yi)
-        # local model output
-        validy,validx = np.nonzero(np.logical_not(val[variable].mask))
-        # check if any model longitudes are -180:180
-        X = np.where(IX[validy,validx] <= 0.0,
-            IX[validy,validx] + 360.0, IX[validy,validx])
-        # grid indices of local model
-        ii = ((X - x30[0])//d30).astype('i')
-        jj = ((IY[validy,validx] - y30[0])//d30).astype('i')
+        # valid points of local model and indices within global grid
+        validy,validx,jj,ii = _local_indices(val, variable,
+            x30[0], y30[0], spacing=d30)
         # fill global mask with regional solution
-        m30[jj,ii] = 1
+        # using flattened indices of the valid points
+        m30.data.put(jj*len(x30) + ii, 1)
     # return the 2 arc-minute mask
     m30.mask = (m30.data == m30.fill_value)
     return m30
@@ -1574,7 +1841,8 @@ def interpolate_atlas_model(
         xi: np.ndarray,
         yi: np.ndarray,
         zi: np.ndarray,
-        spacing: float = 1.0/30.0
+        spacing: float = 1.0/30.0,
+        chunk: int = 256
     ):
     """
     Interpolates global ATLAS tidal solutions into a
@@ -1590,6 +1858,8 @@ def interpolate_atlas_model(
         global tide model data
     spacing: float
         output grid spacing
+    chunk: int, default 256
+        number of output rows to interpolate at a time
 
     Returns
     -------
@@ -1603,18 +1873,25 @@ def interpolate_atlas_model(
     # create resampled grid dimensions
     xs = np.arange(spacing/2.0, 360.0 + spacing/2.0, spacing)
     ys = np.arange(-90.0 + spacing/2.0, 90.0 + spacing/2.0, spacing)
+    # clip resampled coordinates to the limits of the global solution
+    x = np.clip(xs, xi[0], xi[-1])
+    y = np.clip(ys, yi[0], yi[-1])
+    # indices and weights of the global cells for each column and row
+    ix = np.clip(pyTMD.interpolate._grid_indices(xi, x), 0, len(xi) - 2)
+    iy = np.clip(pyTMD.interpolate._grid_indices(yi, y), 0, len(yi) - 2)
+    wx = (x - xi[ix])/(xi[ix+1] - xi[ix])
+    wy = (y - yi[iy])/(yi[iy+1] - yi[iy])
     # interpolate global solution
     zs = np.ma.zeros((len(ys),len(xs)), dtype=zi.dtype)
     zs.mask = np.zeros((len(ys),len(xs)), dtype=bool)
-    # test if combining elevation/transport variables with complex components
-    if np.iscomplexobj(zs):
-        f1 = scipy.interpolate.RectBivariateSpline(xi, yi, zi.real.T, kx=1,ky=1)
-        f2 = scipy.interpolate.RectBivariateSpline(xi, yi, zi.imag.T, kx=1,ky=1)
-        zs.data.real[:,:] = f1(xs,ys).T
-        zs.data.imag[:,:] = f2(xs,ys).T
-    else:
-        f = scipy.interpolate.RectBivariateSpline(xi, yi, zi.T, kx=1,ky=1)
-        zs.data[:,:] = f(xs,ys).T
+    # interpolate real or complex variables along the global rows
+    # using the data values of masked arrays
+    data = np.ma.getdata(zi)
+    temp = data[iy,:]*(1.0 - wy[:,None]) + data[iy+1,:]*wy[:,None]
+    # interpolate along the global columns in blocks of rows
+    for j in range(0, len(ys), chunk):
+        r = slice(j, j + chunk)
+        zs.data[r,:] = temp[r,ix]*(1.0 - wx) + temp[r,ix+1]*wx
     # return resampled solution and coordinates
     return (xs, ys, zs)
 
@@ -1666,32 +1943,19 @@ def combine_atlas_model(
     x30, y30, z30 = interpolate_atlas_model(xi, yi, zi, spacing=d30)
     # iterate over localized solutions
     for key,val in local.items():
-        # shape of local variable
-        ny, nx = np.shape(val[variable])
-        # correct limits for local grid
-        lon0 = np.floor(val['lon'][0]/d30)*d30
-        lat0 = np.floor(val['lat'][0]/d30)*d30
-        # create latitude and longitude for local model
-        xi = lon0 + np.arange(nx)*d30
-        yi = lat0 + np.arange(ny)*d30
-        IX,IY = np.meshgrid(xi,yi)
-        # local model output
-        validy,validx = np.nonzero(np.logical_not(val[variable].mask))
-        # check if any model longitudes are -180:180
-        X = np.where(IX[validy,validx] <= 0.0,
-            IX[validy,validx] + 360.0, IX[validy,validx])
-        # grid indices of local model
-        ii = ((X - x30[0])//d30).astype('i')
-        jj = ((IY[validy,validx] - y30[0])//d30).astype('i')
-        # fill global mask with regional solution
-        z30.data[jj,ii] = val[variable][validy,validx]
+        # valid points of local model and indices within global grid
+        validy,validx,jj,ii = _local_indices(val, variable,
+            x30[0], y30[0], spacing=d30)
+        # fill global solution with valid regional values
+        # using flattened indices in row-major order
+        z30.data.put(jj*len(x30) + ii, val[variable].compressed())
     # return 2 arc-minute solution and coordinates
     return (x30, y30, z30)
 
 # PURPOSE: read netCDF4 file to extract real and imaginary components for
 # constituent
 def read_netcdf_file(
-        input_file: str | pathlib.Path,
+        input_file: str | pathlib.Path | netCDF4.Dataset,
         ic: int,
         variable: str | None = None
     ):
@@ -1700,8 +1964,8 @@ def read_netcdf_file(
 
     Parameters
     ----------
-    input_file: str or pathlib.Path
-        input transport file
+    input_file: str, pathlib.Path or netCDF4.Dataset
+        input transport file or open netCDF4 dataset
     ic: int
         index of constituent
     variable: str or NoneType, default None
@@ -1718,34 +1982,40 @@ def read_netcdf_file(
     hc: complex
         complex form of tidal constituent oscillation
     """
-    # tilde-expand input file
-    input_file = pathlib.Path(input_file).expanduser()
-    # read the netcdf format tide grid file
-    fileID = netCDF4.Dataset(input_file, 'r')
+    # read the netcdf format tide file if not already open
+    is_open = not isinstance(input_file, (str, pathlib.Path))
+    if is_open:
+        fileID = input_file
+    else:
+        # tilde-expand input file
+        input_file = pathlib.Path(input_file).expanduser()
+        fileID = netCDF4.Dataset(input_file, 'r')
     # variable dimensions
     nx = fileID.dimensions['x'].size
     ny = fileID.dimensions['y'].size
     # real and imaginary components of tidal constituent
     hc = np.ma.zeros((ny, nx), dtype=np.complex64)
     hc.mask = np.zeros((ny, nx), dtype=bool)
-    # extract constituent and flip y orientation
+    # extract constituent with contiguous reads
+    # and flip y orientation in memory
     if (variable == 'z'):
-        hc.data.real[:,:] = fileID.variables['hRe'][ic,::-1,:]
-        hc.data.imag[:,:] = -fileID.variables['hIm'][ic,::-1,:]
+        hc.data.real[:,:] = fileID.variables['hRe'][ic,:,:][::-1,:]
+        hc.data.imag[:,:] = -fileID.variables['hIm'][ic,:,:][::-1,:]
     elif variable in ('U','u'):
-        hc.data.real[:,:] = fileID.variables['URe'][ic,::-1,:]
-        hc.data.imag[:,:] = -fileID.variables['UIm'][ic,::-1,:]
+        hc.data.real[:,:] = fileID.variables['URe'][ic,:,:][::-1,:]
+        hc.data.imag[:,:] = -fileID.variables['UIm'][ic,:,:][::-1,:]
     elif variable in ('V','v'):
-        hc.data.real[:,:] = fileID.variables['VRe'][ic,::-1,:]
-        hc.data.imag[:,:] = -fileID.variables['VIm'][ic,::-1,:]
-    # close the file
-    fileID.close()
+        hc.data.real[:,:] = fileID.variables['VRe'][ic,:,:][::-1,:]
+        hc.data.imag[:,:] = -fileID.variables['VIm'][ic,:,:][::-1,:]
+    # close the file if opened here
+    if not is_open:
+        fileID.close()
     # return output variables
     return hc
 
 # PURPOSE: output grid file in OTIS format
 def output_otis_grid(
-        FILE: str | pathlib.Path,
+        FILE: str | pathlib.Path | io.IOBase,
         xlim: np.ndarray | list,
         ylim: np.ndarray | list,
         hz: np.ndarray,
@@ -1758,8 +2028,8 @@ def output_otis_grid(
 
     Parameters
     ----------
-    FILE: str or pathlib.Path
-        output OTIS grid file name
+    FILE: str, pathlib.Path or io.IOBase
+        output OTIS grid file name or open binary file object
     xlim: np.ndarray
         x-coordinate grid-cell edges of output grid
     ylim: np.ndarray
@@ -1773,59 +2043,58 @@ def output_otis_grid(
     dt: float
         time step
     """
-    # tilde-expand output file
-    FILE = pathlib.Path(FILE).expanduser()
-    # open output file
-    fid = FILE.open(mode='wb')
+    # open output file if not already open
+    is_open = not isinstance(FILE, (str, pathlib.Path))
+    if is_open:
+        fid = FILE
+    else:
+        # tilde-expand output file
+        FILE = pathlib.Path(FILE).expanduser()
+        fid = FILE.open(mode='wb')
     nob = len(iob)
     ny, nx = np.shape(hz)
+    # write header with grid dimensions, limits and time step
     reclen = 32
-    fid.write(struct.pack('>i',reclen))
-    fid.write(struct.pack('>i',nx))
-    fid.write(struct.pack('>i',ny))
-    ylim.tofile(fid,format='>f4')
-    xlim.tofile(fid,format='>f4')
-    fid.write(struct.pack('>f',dt))
-    fid.write(struct.pack('>i',nob))
-    fid.write(struct.pack('>i',reclen))
+    header = struct.pack('>3i', reclen, nx, ny)
+    header += np.asarray(ylim, dtype='>f4').tobytes()
+    header += np.asarray(xlim, dtype='>f4').tobytes()
+    header += struct.pack('>f2i', dt, nob, reclen)
+    fid.write(header)
+    # write open boundary indices
     if (nob == 0):
-        fid.write(struct.pack('>i',4))
-        fid.write(struct.pack('>i',0))
-        fid.write(struct.pack('>i',4))
+        fid.write(struct.pack('>3i', 4, 0, 4))
     else:
         reclen = 8*nob
         fid.write(struct.pack('>i',reclen))
-        iob.tofile(fid,format='>i4')
+        fid.write(np.asarray(iob, dtype='>i4').tobytes())
         fid.write(struct.pack('>i',reclen))
     reclen = 4*nx*ny
     # write depth and mask data to file
     fid.write(struct.pack('>i',reclen))
-    hz.tofile(fid,format='>f4')
-    for m in range(ny):
-        hz[m,:].tofile(fid,format='>f4')
+    fid.write(np.ascontiguousarray(hz, dtype='>f4'))
+    fid.write(struct.pack('>2i', reclen, reclen))
+    fid.write(np.ascontiguousarray(mz, dtype='>i4'))
     fid.write(struct.pack('>i',reclen))
-    fid.write(struct.pack('>i',reclen))
-    for m in range(ny):
-        mz[m,:].tofile(fid,format='>i4')
-    fid.write(struct.pack('>i',reclen))
-    # close the output OTIS file
-    fid.close()
+    # close the output OTIS file if opened here
+    if not is_open:
+        fid.close()
 
 # PURPOSE: output elevation file in OTIS format
 def output_otis_elevation(
-        FILE: str | pathlib.Path,
+        FILE: str | pathlib.Path | io.IOBase,
         h: np.ndarray,
         xlim: np.ndarray | list,
         ylim: np.ndarray | list,
-        constituents: list
+        constituents: list,
+        **kwargs
     ):
     """
     Writes OTIS-format elevation files
 
     Parameters
     ----------
-    FILE: str or pathlib.Path
-        output OTIS elevation file name
+    FILE: str, pathlib.Path or io.IOBase
+        output OTIS elevation file name or open binary file object
     h: np.ndarray
         Eulerian form of tidal height oscillation
     xlim: np.ndarray
@@ -1834,52 +2103,60 @@ def output_otis_elevation(
         y-coordinate grid-cell edges of output grid
     constituents: list
         tidal constituent IDs
+    threads: int, default from ``PYTMD_NTHREADS`` or 1
+        Maximum number of threads for interleaving constituents
     """
-    # tilde-expand output file
-    FILE = pathlib.Path(FILE).expanduser()
-    # open output file
-    fid = FILE.open(mode='wb')
+    # set default keyword arguments
+    kwargs.setdefault('threads', _default_threads())
+    # open output file if not already open
+    is_open = not isinstance(FILE, (str, pathlib.Path))
+    if is_open:
+        fid = FILE
+    else:
+        # tilde-expand output file
+        FILE = pathlib.Path(FILE).expanduser()
+        fid = FILE.open(mode='wb')
     ny, nx, nc = np.shape(h)
     # length of header: allow for 4 character >i c_id strings
     header_length = 4*(7 + nc)
-    fid.write(struct.pack('>i',header_length))
-    fid.write(struct.pack('>i',nx))
-    fid.write(struct.pack('>i',ny))
-    fid.write(struct.pack('>i',nc))
-    ylim.tofile(fid,format='>f4')
-    xlim.tofile(fid,format='>f4')
-    for c in constituents:
-        fid.write(c.ljust(4).encode('utf8'))
-    fid.write(struct.pack('>i',header_length))
+    header = struct.pack('>4i', header_length, nx, ny, nc)
+    header += np.asarray(ylim, dtype='>f4').tobytes()
+    header += np.asarray(xlim, dtype='>f4').tobytes()
+    header += b''.join(c.ljust(4).encode('utf8') for c in constituents)
+    header += struct.pack('>i', header_length)
+    fid.write(header)
+    # interleave real and imaginary components for a constituent
+    def _interleave(ic: int):
+        temp = np.empty((ny,2*nx),dtype='>f')
+        temp[:,0::2] = h.real[:,:,ic]
+        temp[:,1::2] = h.imag[:,:,ic]
+        return temp
+
     # write each constituent to file
     constituent_header = 8*nx*ny
-    for ic in range(nc):
-        fid.write(struct.pack('>i',constituent_header))
-        for m in range(ny):
-            temp = np.zeros((2*nx),dtype='>f')
-            temp[0:2*nx-1:2] = h.real[m,:,ic]
-            temp[1:2*nx:2] = h.imag[m,:,ic]
-            temp.tofile(fid,format='>f4')
-        fid.write(struct.pack('>i',constituent_header))
-    # close the output OTIS file
-    fid.close()
+    _write_records(fid, _interleave, nc, constituent_header,
+        threads=kwargs['threads'])
+    # close the output OTIS file if opened here
+    if not is_open:
+        fid.close()
 
 # PURPOSE: output transport file in OTIS format
 def output_otis_transport(
-        FILE: str | pathlib.Path,
+        FILE: str | pathlib.Path | io.IOBase,
         u: np.ndarray,
         v: np.ndarray,
         xlim: np.ndarray | list,
         ylim: np.ndarray | list,
-        constituents: list
+        constituents: list,
+        **kwargs
     ):
     """
     Writes OTIS-format transport files
 
     Parameters
     ----------
-    FILE: str or pathlib.Path
-        output OTIS transport file name
+    FILE: str, pathlib.Path or io.IOBase
+        output OTIS transport file name or open binary file object
     u: complex
         Eulerian form of tidal zonal transport oscillation
     v: complex
@@ -1890,37 +2167,218 @@ def output_otis_transport(
         y-coordinate grid-cell edges of output grid
     constituents: list
         tidal constituent IDs
+    threads: int, default from ``PYTMD_NTHREADS`` or 1
+        Maximum number of threads for interleaving constituents
     """
-    # tilde-expand output file
-    FILE = pathlib.Path(FILE).expanduser()
-    # open output file
-    fid = FILE.open(mode='wb')
+    # set default keyword arguments
+    kwargs.setdefault('threads', _default_threads())
+    # open output file if not already open
+    is_open = not isinstance(FILE, (str, pathlib.Path))
+    if is_open:
+        fid = FILE
+    else:
+        # tilde-expand output file
+        FILE = pathlib.Path(FILE).expanduser()
+        fid = FILE.open(mode='wb')
     ny, nx, nc = np.shape(u)
     # length of header: allow for 4 character >i c_id strings
     header_length = 4*(7 + nc)
-    fid.write(struct.pack('>i',header_length))
-    fid.write(struct.pack('>i',nx))
-    fid.write(struct.pack('>i',ny))
-    fid.write(struct.pack('>i',nc))
-    ylim.tofile(fid,format='>f4')
-    xlim.tofile(fid,format='>f4')
-    for c in constituents:
-        fid.write(c.ljust(4).encode('utf8'))
-    fid.write(struct.pack('>i',header_length))
+    header = struct.pack('>4i', header_length, nx, ny, nc)
+    header += np.asarray(ylim, dtype='>f4').tobytes()
+    header += np.asarray(xlim, dtype='>f4').tobytes()
+    header += b''.join(c.ljust(4).encode('utf8') for c in constituents)
+    header += struct.pack('>i', header_length)
+    fid.write(header)
+    # interleave real and imaginary components for a constituent
+    def _interleave(ic: int):
+        temp = np.empty((ny,4*nx),dtype='>f')
+        temp[:,0::4] = u.real[:,:,ic]
+        temp[:,1::4] = u.imag[:,:,ic]
+        temp[:,2::4] = v.real[:,:,ic]
+        temp[:,3::4] = v.imag[:,:,ic]
+        return temp
+
     # write each constituent to file
     constituent_header = 2*8*nx*ny
-    for ic in range(nc):
-        fid.write(struct.pack('>i',constituent_header))
-        for m in range(ny):
-            temp = np.zeros((4*nx),dtype='>f')
-            temp[0:4*nx-3:4] = u.real[m,:,ic]
-            temp[1:4*nx-2:4] = u.imag[m,:,ic]
-            temp[2:4*nx-1:4] = v.real[m,:,ic]
-            temp[3:4*nx:4] = v.imag[m,:,ic]
-            temp.tofile(fid,format='>f4')
-        fid.write(struct.pack('>i',constituent_header))
-    # close the output OTIS file
-    fid.close()
+    _write_records(fid, _interleave, nc, constituent_header,
+        threads=kwargs['threads'])
+    # close the output OTIS file if opened here
+    if not is_open:
+        fid.close()
+
+# PURPOSE: default number of threads for processing constituents
+def _default_threads():
+    """
+    Get the default number of threads for processing OTIS constituents
+    from the ``PYTMD_NTHREADS`` environment variable
+
+    Returns
+    -------
+    threads: int
+        number of threads (default 1)
+    """
+    return int(os.environ.get('PYTMD_NTHREADS', 1))
+
+# PURPOSE: read and cache tide model grid files
+@functools.lru_cache(maxsize=2)
+def _read_grid(
+        grid_file: str,
+        mtime: int,
+        grid: str = 'OTIS'
+    ):
+    """
+    Reads and caches OTIS, ATLAS and TMD3 grid files for repeated calls
+
+    Parameters
+    ----------
+    grid_file: str
+        resolved path of the model grid file
+    mtime: int
+        modification time of the grid file in nanoseconds
+    grid: str, default 'OTIS'
+        Tide model file type to read
+
+            - ``'ATLAS'``: reading a global solution with localized solutions
+            - ``'OTIS'``: combined global or local solution
+            - ``'TMD3'``: combined global or local netCDF4 solution
+
+    Returns
+    -------
+    xi: np.ndarray
+        x-coordinates of tide model grid
+    yi: np.ndarray
+        y-coordinates of tide model grid
+    hz: np.ndarray
+        model bathymetry
+    mz: np.ndarray
+        land/water mask (True for invalid points)
+    ancillary: tuple, np.ndarray or NoneType
+        global grid for ATLAS models or flexure scaling factor for TMD3
+
+    Notes
+    -----
+    Returned arrays are shared between calls and are set as read-only.
+    Cached grids are kept for the life of the process and can be
+    released with ``_read_grid.cache_clear()``
+    """
+    if (grid == 'ATLAS'):
+        # if reading a global solution with localized solutions
+        x0,y0,hz0,mz0,iob,dt,pmask,local = read_atlas_grid(grid_file)
+        xi,yi,hz = combine_atlas_model(x0,y0,hz0,pmask,local,variable='depth')
+        mz = create_atlas_mask(x0,y0,mz0,local,variable='depth')
+        ancillary = (x0,y0,pmask)
+    elif (grid == 'TMD3'):
+        # if reading a single TMD3 netCDF4 solution
+        xi,yi,hz,mz,ancillary = read_netcdf_grid(grid_file)
+    else:
+        # if reading a single OTIS solution
+        xi,yi,hz,mz,iob,dt = read_otis_grid(grid_file)
+        ancillary = None
+    # invert tide mask to be True for invalid points
+    mz = np.logical_not(mz).astype(mz.dtype)
+    # set cached arrays and masks as read-only
+    arrays = [xi, yi, hz, mz]
+    arrays.extend(ancillary if isinstance(ancillary, tuple) else [ancillary])
+    for a in arrays:
+        if isinstance(a, np.ndarray):
+            a.flags.writeable = False
+        if np.ma.isMA(a) and (a.mask is not np.ma.nomask):
+            a.mask.flags.writeable = False
+    return (xi, yi, hz, mz, ancillary)
+
+# PURPOSE: find or calculate KD-trees of valid points for extrapolation
+def _extrapolate_tree(
+        trees: list,
+        xi: np.ndarray,
+        yi: np.ndarray,
+        hc: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        **kwargs
+    ):
+    """
+    Finds or calculates the KD-tree of valid model points for
+    extrapolating a constituent
+
+    Parameters
+    ----------
+    trees: list
+        previously calculated KD-trees with valid masks and output points
+    xi: np.ndarray
+        x-coordinates of tide model grid
+    yi: np.ndarray
+        y-coordinates of tide model grid
+    hc: np.ndarray
+        tide model constituent
+    x: np.ndarray
+        output x-coordinates
+    y: np.ndarray
+        output y-coordinates
+    **kwargs: dict
+        keyword arguments for ``pyTMD.interpolate._extrapolate_tree``
+
+    Returns
+    -------
+    tree: tuple
+        KD-tree of valid model points with grid indices and output points
+    """
+    # valid model points of the constituent
+    valid = np.logical_not(np.ma.getmaskarray(hc)) & np.isfinite(hc.data)
+    # reuse the tree for constituents with the same valid and output points
+    for mask, ox, oy, tree in trees:
+        if np.array_equal(mask, valid) and np.array_equal(ox, x) and \
+            np.array_equal(oy, y):
+            return tree
+    # calculate and save the tree for the valid and output points
+    tree = pyTMD.interpolate._extrapolate_tree(xi, yi, valid, x, y, **kwargs)
+    trees.append((valid, x, y, tree))
+    return tree
+
+# PURPOSE: encode and write records in order
+def _write_records(
+        fid: io.IOBase,
+        encode,
+        n: int,
+        reclen: int,
+        threads: int = 1
+    ):
+    """
+    Encode Fortran records in a pool of threads and write each
+    record to file in order as it completes
+
+    Parameters
+    ----------
+    fid: io.IOBase
+        open binary file object
+    encode: callable
+        function returning the big-endian buffer for a record index
+    n: int
+        number of records
+    reclen: int
+        length of each record in bytes
+    threads: int, default 1
+        maximum number of threads for encoding records
+    """
+    threads = min(n, threads)
+    # encode and write each record serially
+    if (threads <= 1):
+        for i in range(n):
+            # write the record with leading and trailing lengths
+            fid.write(struct.pack('>i', reclen))
+            fid.write(encode(i))
+            fid.write(struct.pack('>i', reclen))
+        return
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        # encode at most one record for each thread ahead of the writer
+        pending = [executor.submit(encode, i) for i in range(threads)]
+        for i in range(n):
+            buffer = pending.pop(0).result()
+            if (i + threads < n):
+                pending.append(executor.submit(encode, i + threads))
+            # write the record with leading and trailing lengths
+            fid.write(struct.pack('>i', reclen))
+            fid.write(buffer)
+            fid.write(struct.pack('>i', reclen))
 
 # PURPOSE: Extend a longitude array
 def _extend_array(input_array: np.ndarray, step_size: float):
@@ -1940,7 +2398,7 @@ def _extend_array(input_array: np.ndarray, step_size: float):
         extended array
     """
     n = len(input_array)
-    temp = np.zeros((n+2), dtype=input_array.dtype)
+    temp = np.empty((n+2), dtype=input_array.dtype)
     # extended array [x-1,x0,...,xN,xN+1]
     temp[0] = input_array[0] - step_size
     temp[1:-1] = input_array[:]
@@ -1962,16 +2420,15 @@ def _extend_matrix(input_matrix: np.ndarray):
     temp: np.ndarray
         extended matrix
     """
-    ny, nx = np.shape(input_matrix)
-    # allocate for extended matrix
+    # extend matrix [xN,x0,...,xN,x0]
+    data = np.ma.getdata(input_matrix)
+    temp = np.concatenate((data[...,-1:], data, data[...,:1]), axis=-1)
+    # extend mask separately for masked arrays
     if np.ma.isMA(input_matrix):
-        temp = np.ma.zeros((ny, nx+2), dtype=input_matrix.dtype)
-    else:
-        temp = np.zeros((ny, nx+2), dtype=input_matrix.dtype)
-    # extend matrix
-    temp[:,0] = input_matrix[:,-1]
-    temp[:,1:-1] = input_matrix[:,:]
-    temp[:,-1] = input_matrix[:,0]
+        mask = np.ma.getmask(input_matrix)
+        if (mask is not np.ma.nomask):
+            mask = np.concatenate((mask[...,-1:], mask, mask[...,:1]), axis=-1)
+        temp = np.ma.array(temp, mask=mask)
     return temp
 
 # PURPOSE: crop data to bounds
@@ -2010,30 +2467,133 @@ def _crop(
     y: np.ndarray
         cropped y-coordinates
     """
+    # calculate indices for cropping
+    rows, cols, x, y = _crop_indices(ix, iy, bounds,
+        buffer=buffer, is_geographic=is_geographic)
+    # crop matrix
+    temp = input_matrix[rows, cols]
+    # return cropped data
+    return (temp, x, y)
+
+# PURPOSE: calculate indices for cropping tide model data
+def _crop_indices(
+        ix: np.ndarray,
+        iy: np.ndarray,
+        bounds: list | tuple,
+        buffer: int | float = 0,
+        is_geographic: bool = True,
+    ):
+    """
+    Calculate indices for cropping tide model data to bounds
+
+    Parameters
+    ----------
+    ix: np.ndarray
+        x-coordinates of input grid
+    iy: np.ndarray
+        y-coordinates of input grid
+    bounds: list, tuple
+        bounding box: ``[xmin, xmax, ymin, ymax]``
+    buffer: int or float, default 0
+        buffer to add to bounds for cropping
+    is_geographic: bool, default True
+        input grid is in geographic coordinates
+
+    Returns
+    -------
+    rows: slice
+        row indices for cropping
+    cols: slice or np.ndarray
+        column indices for cropping
+    x: np.ndarray
+        cropped x-coordinates
+    y: np.ndarray
+        cropped y-coordinates
+    """
+    # column indices of the input grid
+    cols = np.arange(len(ix))
     # adjust longitudinal convention of tide model
-    if is_geographic & (np.min(bounds[:2]) < 0.0) & (np.max(ix) > 180.0):
-        input_matrix, ix, = _shift(input_matrix, ix,
+    if is_geographic & (np.min(bounds[:2]) < 0.0) & (ix[-1] > 180.0):
+        cols, ix, = _shift(cols[np.newaxis,:], ix,
             x0=180.0, cyclic=360.0, direction='west')
-    elif is_geographic & (np.max(bounds[:2]) > 180.0) & (np.min(ix) < 0.0):
-        input_matrix, ix, = _shift(input_matrix, ix,
+    elif is_geographic & (np.max(bounds[:2]) > 180.0) & (ix[0] < 0.0):
+        cols, ix, = _shift(cols[np.newaxis,:], ix,
             x0=0.0, cyclic=360.0, direction='east')
     # unpack bounds and buffer
     xmin = bounds[0] - buffer
     xmax = bounds[1] + buffer
     ymin = bounds[2] - buffer
     ymax = bounds[3] + buffer
-    # find indices for cropping
-    yind = np.flatnonzero((iy >= ymin) & (iy <= ymax))
-    xind = np.flatnonzero((ix >= xmin) & (ix <= xmax))
+    # find indices for cropping from the sorted grid coordinates
+    i0 = np.searchsorted(ix, xmin, side='left')
+    i1 = np.searchsorted(ix, xmax, side='right')
+    j0 = np.searchsorted(iy, ymin, side='left')
+    j1 = np.searchsorted(iy, ymax, side='right')
     # slices for cropping axes
-    rows = slice(yind[0], yind[-1]+1)
-    cols = slice(xind[0], xind[-1]+1)
-    # crop matrix
-    temp = input_matrix[rows, cols]
-    x = ix[cols]
+    rows = slice(j0, j1)
+    x = ix[i0:i1]
     y = iy[rows]
-    # return cropped data
-    return (temp, x, y)
+    # use column slices if the grid was not shifted
+    if (cols.ndim == 1):
+        cols = slice(i0, i1)
+    else:
+        cols = cols[0, i0:i1]
+    # return the indices and cropped coordinates
+    return (rows, cols, x, y)
+
+# PURPOSE: calculate global grid indices of a local solution
+def _local_indices(
+        local: dict,
+        variable: str,
+        x0: float,
+        y0: float,
+        spacing: float = 1.0/30.0
+    ):
+    """
+    Calculate the indices of valid points within a local ATLAS
+    solution and their indices within the high-resolution global grid
+
+    Parameters
+    ----------
+    local: dict
+        local tidal solution
+    variable: str
+        key for variable within the local solution
+    x0: float
+        first x-coordinate of high-resolution global grid
+    y0: float
+        first y-coordinate of high-resolution global grid
+    spacing: float, default 1.0/30.0
+        grid spacing of high-resolution global grid
+
+    Returns
+    -------
+    validy: np.ndarray
+        row indices of valid points within local solution
+    validx: np.ndarray
+        column indices of valid points within local solution
+    jj: np.ndarray
+        row indices of valid points within global grid
+    ii: np.ndarray
+        column indices of valid points within global grid
+    """
+    # shape of local variable
+    ny, nx = np.shape(local[variable])
+    # correct limits for local grid
+    lon0 = np.floor(local['lon'][0]/spacing)*spacing
+    lat0 = np.floor(local['lat'][0]/spacing)*spacing
+    # create longitude and latitude for local model
+    xi = lon0 + np.arange(nx)*spacing
+    yi = lat0 + np.arange(ny)*spacing
+    # check if any model longitudes are -180:180
+    xi[xi <= 0.0] += 360.0
+    # grid indices of each local column and row
+    icol = ((xi - x0)//spacing).astype('i')
+    irow = ((yi - y0)//spacing).astype('i')
+    # local model output
+    validy,validx = np.nonzero(np.logical_not(local[variable].mask))
+    # return the local and global indices of valid points
+    return (validy, validx, irow[validy], icol[validx])
 
 # PURPOSE: shift a grid east or west
 def _shift(
@@ -2069,26 +2629,25 @@ def _shift(
     x: np.ndarray
         shifted x-coordinates
     """
-    # find the starting index if cyclic
-    offset = 0 if (np.fabs(ix[-1]-ix[0]-cyclic) > 1e-4) else 1
+    # find the starting index
+    n = len(ix)
     i0 = np.argmin(np.fabs(ix - x0))
-    # shift longitudinal values
-    x = np.zeros(ix.shape, ix.dtype)
-    x[0:-i0] = ix[i0:]
-    x[-i0:] = ix[offset: i0+offset]
+    # shift longitudinal values and data values
+    # if the grid does not already start at the new base longitude
+    if (i0 > 0):
+        # find the starting index of the wrapped columns if cyclic
+        offset = 0 if (np.fabs(ix[-1]-ix[0]-cyclic) > 1e-4) else 1
+        indices = np.r_[i0:n, offset:i0+offset]
+        x = ix[indices]
+        temp = input_matrix[:,indices]
+    else:
+        x = ix.copy()
+        temp = input_matrix
     # add or remove the cyclic
     if (direction == 'east'):
-        x[-i0:] += cyclic
+        x[n-i0:] += cyclic
     elif (direction == 'west'):
-        x[0:-i0] -= cyclic
-    # allocate for shifted data
-    if np.ma.isMA(input_matrix):
-        temp = np.ma.zeros(input_matrix.shape,input_matrix.dtype)
-    else:
-        temp = np.zeros(input_matrix.shape, input_matrix.dtype)
-    # shift data values
-    temp[:,:-i0] = input_matrix[:,i0:]
-    temp[:,-i0:] = input_matrix[:,offset: i0+offset]
+        x[:n-i0] -= cyclic
     # return the shifted values
     return (temp, x)
 
@@ -2123,22 +2682,27 @@ def _interpolate_mask(mz: np.ndarray, is_global: bool = True):
         input grid is global in terms of longitude
     """
     # shape of input mask
+    mz = np.asarray(mz)
     ny, nx = np.shape(mz)
     # initialize integer masks for u and v grids
     mu = np.zeros((ny, nx), dtype=int)
     mv = np.zeros((ny, nx), dtype=int)
-    # wrap mask if global
-    mode = 'wrap' if is_global else 'edge'
     # calculate masks on u and v grids
-    tmp = np.pad(mz, ((0, 0), (1, 0)), mode=mode)
-    mu[:,:] = (tmp[:,:-1]*tmp[:,1:])
-    tmp = np.pad(mz, ((1, 0), (0, 0)), mode='edge')
-    mv[:,:] = (tmp[:-1,:]*tmp[1:,:])
+    mu[:,1:] = (mz[:,:-1]*mz[:,1:])
+    mv[1:,:] = (mz[:-1,:]*mz[1:,:])
+    # wrap mask if global and use edge values otherwise
+    mu[:,0] = (mz[:,-1] if is_global else mz[:,0])*mz[:,0]
+    mv[0,:] = (mz[0,:]*mz[0,:])
     # return the masks
     return (mu, mv)
 
 # PURPOSE: interpolate data to u and v nodes
-def _interpolate_zeta(hz: np.ndarray, is_global: bool = True):
+def _interpolate_zeta(
+        hz: np.ndarray,
+        is_global: bool = True,
+        mu: np.ndarray | None = None,
+        mv: np.ndarray | None = None
+    ):
     """
     Interpolate data from zeta nodes to u and v nodes on a C-grid
 
@@ -2148,20 +2712,25 @@ def _interpolate_zeta(hz: np.ndarray, is_global: bool = True):
         data at grid centers
     is_global: bool, default True
         input grid is global in terms of longitude
+    mu: np.ndarray or NoneType, default None
+        precomputed mask for u nodes
+    mv: np.ndarray or NoneType, default None
+        precomputed mask for v nodes
     """
     # shape of input data
+    hz = np.asarray(hz)
     ny, nx = np.shape(hz)
-    # get masks for u and v nodes
-    mu, mv = _mask_nodes(hz)
+    # get masks for u and v nodes if not provided
+    if (mu is None) or (mv is None):
+        mu, mv = _mask_nodes(hz, is_global=is_global)
     # initialize data for u and v grids
     hu = np.zeros((ny, nx), dtype=hz.dtype)
     hv = np.zeros((ny, nx), dtype=hz.dtype)
-    # wrap data if global
-    mode = 'wrap' if is_global else 'edge'
     # calculate data at u and v nodes
-    tmp = np.pad(hz, ((0, 0), (1, 0)), mode=mode)
-    hu[:,:] = 0.5*mu*(tmp[:,:-1] + tmp[:,1:])
-    tmp = np.pad(hz, ((1, 0), (0, 0)), mode='edge')
-    hv[:,:] = 0.5*mv*(tmp[:-1,:] + tmp[1:,:])
+    hu[:,1:] = 0.5*mu[:,1:]*(hz[:,:-1] + hz[:,1:])
+    hv[1:,:] = 0.5*mv[1:,:]*(hz[:-1,:] + hz[1:,:])
+    # wrap data if global and use edge values otherwise
+    hu[:,0] = 0.5*mu[:,0]*((hz[:,-1] if is_global else hz[:,0]) + hz[:,0])
+    hv[0,:] = 0.5*mv[0,:]*(hz[0,:] + hz[0,:])
     # return the interpolated data values
     return (hu, hv)
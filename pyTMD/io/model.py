@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 u"""
 model.py
-Written by Tyler Sutterley (02/2025)
+Written by Tyler Sutterley (10/2026)
 Retrieves tide model parameters for named tide models and
     from model definition files
 
@@ -11,6 +11,8 @@ PYTHON DEPENDENCIES:
         https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
 
 UPDATE HISTORY:
+    Updated 10/2026: reuse constituents read for the same variable type
+        when interpolating batches of coordinates
     Updated 02/2025: fixed missing grid kwarg for reading from TMD3 models 
     Updated 11/2024: use Love numbers for long-period tides in node equilibrium
     Updated 10/2024: add wrapper functions to read and interpolate constants
@@ -1123,6 +1125,7 @@ class model:
             c.append('node', hc)
         # return the tidal constituents
         self._constituents = c
+        self._constituents_type = kwargs['type']
         return c
 
     def interpolate_constants(self,
@@ -1133,6 +1136,9 @@ class model:
         """
         Interpolate tidal constants to input coordinates
 
+        Model files are read once for each variable type and the
+        constituents are reused for each batch of input coordinates
+
         Parameters
         ----------
         lon: np.ndarray
@@ -1154,8 +1160,9 @@ class model:
         # set default keyword arguments
         kwargs.setdefault('type', self.type)
         kwargs.setdefault('scale', self.scale)
-        # verify constituents have been read
-        if not hasattr(self, '_constituents'):
+        # verify constituents have been read for the variable type
+        if not hasattr(self, '_constituents') or (kwargs['type'] !=
+            getattr(self, '_constituents_type', kwargs['type'])):
             self.read_constants(**kwargs)
         # interpolate tidal constants to grid points
         if self.format in ('OTIS','ATLAS-compact','TMD3'):
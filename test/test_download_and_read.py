@@ -409,6 +409,10 @@ class Test_CATS2008:
         constituents,nc = pyTMD.io.OTIS.read_constituents(elevation_file)
         cons = ['m2','s2','n2','k2','k1','o1','p1','q1','mf','mm']
         assert all(c in constituents for c in cons)
+        # read all constituents from elevation file
+        hc = pyTMD.io.OTIS.read_otis_elevation_stack(elevation_file)
+        assert (hc.shape == (nc,ny,nx))
+        assert (hc.dtype == np.complex64)
         # check dimensions of input grids from elevation and transport files
         for i,c in enumerate(constituents):
             z = pyTMD.io.OTIS.read_otis_elevation(elevation_file,i)
@@ -416,6 +420,12 @@ class Test_CATS2008:
             assert (z.shape == (ny,nx))
             assert (u.shape == (ny,nx))
             assert (v.shape == (ny,nx))
+            # check that constituents are single precision complex
+            assert (z.dtype == np.complex64)
+            assert (u.dtype == np.complex64)
+            assert (v.dtype == np.complex64)
+            # check that constituent is equal to stacked read
+            assert np.all(z == hc[i])
 
     # PURPOSE: Tests check point program
     def test_check_CATS2008(self):
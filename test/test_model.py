@@ -1,8 +1,9 @@
 """
-test_model.py (02/2025)
+test_model.py (10/2026)
 Tests the reading of model definition files
 
 UPDATE HISTORY:
+    Updated 10/2026: test reading constituents when switching variable types
     Updated 02/2025: added function to try to parse bathymetry files
     Updated 09/2024: drop support for the ascii definition file format
         fix parsing of TPXO8-atlas-nc constituents
@@ -19,6 +20,7 @@ import pytest
 import shutil
 import inspect
 import pathlib
+import numpy as np
 import pyTMD.io
 
 # current file path
@@ -790,3 +792,46 @@ def test_read_database():
     # assert that models are accessible
     assert pyTMD.models.elevation.get('CATS2008') is not None
     assert pyTMD.models.current.get('CATS2008') is not None
+
+# PURPOSE: test that constituents are read for each variable type
+def test_constituents_type(tmp_path):
+    """Tests that switching the variable type of a model object
+    reads the constituents for the new type
+    """
+    rng = np.random.default_rng(0)
+    # write synthetic OTIS grid and transport files
+    ny, nx = (10, 12)
+    xlim, ylim = ([100.0, 112.0], [-30.0, -20.0])
+    hz = rng.uniform(100.0, 4000.0, size=(ny, nx))
+    mz = np.ones((ny, nx), dtype=np.int32)
+    pyTMD.io.OTIS.output_otis_grid(tmp_path.joinpath('grid_synthetic'),
+        xlim, ylim, hz, mz, [], 12.0)
+    for c in ['m2','s2']:
+        u = rng.normal(size=(ny, nx, 1)) + 1j*rng.normal(size=(ny, nx, 1))
+        v = rng.normal(size=(ny, nx, 1)) + 1j*rng.normal(size=(ny, nx, 1))
+        pyTMD.io.OTIS.output_otis_transport(
+            tmp_path.joinpath(f'UV_{c}_synthetic'), u, v, xlim, ylim, [c])
+    # write model definition file
+    definition_file = tmp_path.joinpath('model_synthetic.json')
+    model_files = ['UV_m2_synthetic', 'UV_s2_synthetic']
+    parameters = dict(format='OTIS', name='synthetic',
+        grid_file='grid_synthetic', model_file=dict(u=model_files,
+        v=model_files), projection='4326', type=['u','v'], scale=1.0)
+    with definition_file.open(mode='w', encoding='utf8') as fid:
+        json.dump(parameters, fid)
+    # output coordinates within the model grid
+    lon = rng.uniform(102.0, 110.0, size=20)
+    lat = rng.uniform(-28.0, -22.0, size=20)
+    # interpolate each variable type with separate model objects
+    expected = {}
+    for TYPE in ['u','v']:
+        m = pyTMD.io.model(tmp_path).from_file(definition_file)
+        expected[TYPE] = m.interpolate_constants(lon, lat, type=TYPE)
+    assert not np.ma.allclose(expected['u'][0], expected['v'][0])
+    # switch variable types with the same model object
+    m = pyTMD.io.model(tmp_path).from_file(definition_file)
+    for TYPE in ['u','v','u']:
+        amp, ph = m.interpolate_constants(lon, lat, type=TYPE)
+        assert m._constituents_type == TYPE
+        assert np.ma.allclose(amp, expected[TYPE][0])
+        assert np.ma.allclose(ph, expected[TYPE][1])
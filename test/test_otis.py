@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+u"""
+test_otis.py (10/2026)
+Verify the writing and reading of OTIS-format files
+
+UPDATE HISTORY:
+    Updated 10/2026: test interpolating global ATLAS solutions
+    Updated 10/2026: test interpolating regional grids to u and v nodes
+    Updated 10/2026: test shifting grids that start at the base longitude
+    Updated 10/2026: test shifting global grids to a new base longitude
+    Updated 10/2026: test that threaded writes are identical to serial writes
+    Updated 10/2026: test writing OTIS files to open binary file objects
+    Updated 10/2026: test the header records of OTIS files
+    Updated 10/2026: test writing and reading OTIS grid files
+    Written 10/2026
+"""
+import io
+import pytest
+import numpy as np
+import scipy.interpolate
+import pyTMD.io
+
+# PURPOSE: synthetic model constituents with float64 grid limits
+def synthetic_model(nx=7, ny=5, nc=3, seed=0):
+    rng = np.random.default_rng(seed)
+    # grid-cell edges of the model grid
+    xlim = np.array([100.0, 100.0 + nx/6.0], dtype=np.float64)
+    ylim = np.array([-30.0, -30.0 + ny/6.0], dtype=np.float64)
+    constituents = ['m2', 's2', 'k1', 'o1', 'n2', 'p1', 'k2', 'q1'][:nc]
+    # complex constituents with grid dimensions first
+    def random_complex():
+        return rng.normal(size=(ny, nx, nc)) + 1j*rng.normal(size=(ny, nx, nc))
+    return (xlim, ylim, constituents, random_complex, rng)
+
+# PURPOSE: read the dimensions and limits from the header of a file
+def read_header(input_file):
+    with open(input_file, mode='rb') as fid:
+        ll, nx, ny, nc = np.fromfile(fid, dtype='>i4', count=4)
+        ylim = np.fromfile(fid, dtype='>f4', count=2)
+        xlim = np.fromfile(fid, dtype='>f4', count=2)
+        constituents = fid.read(4*nc).decode('utf8').split()
+        tail, = np.fromfile(fid, dtype='>i4', count=1)
+    assert (ll == tail) and (ll == 4*(7 + nc))
+    return (nx, ny, nc, xlim, ylim, constituents)
+
+# PURPOSE: test writing and reading OTIS elevation files
+def test_elevation_round_trip(tmp_path):
+    xlim, ylim, constituents, random_complex, rng = synthetic_model()
+    h = random_complex()
+    ny, nx, nc = np.shape(h)
+    output_file = tmp_path.joinpath('h_synthetic')
+    pyTMD.io.OTIS.output_otis_elevation(output_file, h, xlim, ylim,
+        constituents)
+    # verify the file size and header
+    assert output_file.stat().st_size == 4*(9 + nc) + nc*(8*nx*ny + 8)
+    NX, NY, NC, XLIM, YLIM, CONS = read_header(output_file)
+    assert (NX, NY, NC) == (nx, ny, nc)
+    assert np.all(XLIM == xlim.astype(np.float32))
+    assert np.all(YLIM == ylim.astype(np.float32))
+    assert CONS == constituents
+    # verify each constituent
+    for ic in range(nc):
+        test = pyTMD.io.OTIS.read_otis_elevation(output_file, ic)
+        assert np.all(test.data == h[:,:,ic].astype(np.complex64))
+        assert not np.any(test.mask)
+    # verify all constituents
+    test = pyTMD.io.OTIS.read_otis_elevation_stack(output_file)
+    assert np.all(test.data == np.moveaxis(h, -1, 0).astype(np.complex64))
+
+# PURPOSE: test writing and reading OTIS transport files
+def test_transport_round_trip(tmp_path):
+    xlim, ylim, constituents, random_complex, rng = synthetic_model()
+    u = random_complex()
+    v = random_complex()
+    ny, nx, nc = np.shape(u)
+    output_file = tmp_path.joinpath('UV_synthetic')
+    pyTMD.io.OTIS.output_otis_transport(output_file, u, v, xlim, ylim,
+        constituents)
+    # verify the file size and header
+    assert output_file.stat().st_size == 4*(9 + nc) + nc*(16*nx*ny + 8)
+    NX, NY, NC, XLIM, YLIM, CONS = read_header(output_file)
+    assert (NX, NY, NC) == (nx, ny, nc)
+    assert np.all(XLIM == xlim.astype(np.float32))
+    assert np.all(YLIM == ylim.astype(np.float32))
+    assert CONS == constituents
+    # verify each constituent
+    for ic in range(nc):
+        tu, tv = pyTMD.io.OTIS.read_otis_transport(output_file, ic)
+        assert np.all(tu.data == u[:,:,ic].astype(np.complex64))
+        assert np.all(tv.data == v[:,:,ic].astype(np.complex64))
+        assert not np.any(tu.mask) and not np.any(tv.mask)
+
+# PURPOSE: test writing and reading OTIS grid files
+@pytest.mark.parametrize("NOB", [0, 3])
+def test_grid_round_trip(tmp_path, NOB):
+    xlim, ylim, constituents, random_complex, rng = synthetic_model()
+    ny, nx = (5, 7)
+    hz = rng.uniform(0.0, 4000.0, size=(ny, nx))
+    mz = (hz > 1000.0).astype(np.int32)
+    iob = rng.integers(1, 5, size=(NOB, 2))
+    dt = 12.0
+    output_file = tmp_path.joinpath('grid_synthetic')
+    pyTMD.io.OTIS.output_otis_grid(output_file, xlim, ylim, hz, mz,
+        iob, dt)
+    x, y, HZ, MZ, IOB, DT = pyTMD.io.OTIS.read_otis_grid(output_file)
+    # verify grid coordinates at the centers of the grid cells
+    dx = (xlim[1] - xlim[0])/nx
+    dy = (ylim[1] - ylim[0])/ny
+    assert np.allclose(x, np.linspace(xlim[0]+dx/2.0, xlim[1]-dx/2.0, nx))
+    assert np.allclose(y, np.linspace(ylim[0]+dy/2.0, ylim[1]-dy/2.0, ny))
+    # verify bathymetry, mask, open boundaries and time step
+    assert np.all(HZ == hz.astype(np.float32))
+    assert np.all(MZ == mz)
+    assert np.all(np.reshape(IOB, (-1, 2)) == iob)
+    assert (DT == dt)
+
+# PURPOSE: test the header records of OTIS grid files
+def test_grid_header(tmp_path):
+    xlim, ylim, constituents, random_complex, rng = synthetic_model()
+    ny, nx = (5, 7)
+    hz = rng.uniform(0.0, 4000.0, size=(ny, nx))
+    mz = np.ones((ny, nx), dtype=np.int32)
+    output_file = tmp_path.joinpath('grid_synthetic')
+    pyTMD.io.OTIS.output_otis_grid(output_file, xlim, ylim, hz, mz, [], 12.0)
+    # read the header record and the empty open boundary record
+    dtype = np.dtype([('head', '>i4'), ('nx', '>i4'), ('ny', '>i4'),
+        ('ylim', '>f4', (2,)), ('xlim', '>f4', (2,)), ('dt', '>f4'),
+        ('nob', '>i4'), ('tail', '>i4'), ('iob', '>i4', (3,))])
+    header, = np.fromfile(output_file, dtype=dtype, count=1)
+    assert (header['head'] == 32) and (header['tail'] == 32)
+    assert (header['nx'] == nx) and (header['ny'] == ny)
+    assert np.all(header['xlim'] == xlim.astype(np.float32))
+    assert np.all(header['ylim'] == ylim.astype(np.float32))
+    assert (header['dt'] == 12.0) and (header['nob'] == 0)
+    assert np.all(header['iob'] == [4, 0, 4])
+    # verify the file size
+    assert output_file.stat().st_size == 40 + 12 + 2*(4*nx*ny + 8)
+
+# PURPOSE: test writing OTIS files to open binary file objects
+def test_file_objects(tmp_path):
+    xlim, ylim, constituents, random_complex, rng = synthetic_model()
+    h = random_complex()
+    u = random_complex()
+    v = random_complex()
+    ny, nx, nc = np.shape(h)
+    hz = rng.uniform(0.0, 4000.0, size=(ny, nx))
+    mz = np.ones((ny, nx), dtype=np.int32)
+    # write each file to a path and to an in-memory file object
+    output_file = tmp_path.joinpath('grid_synthetic')
+    pyTMD.io.OTIS.output_otis_grid(output_file, xlim, ylim, hz, mz, [], 12.0)
+    fid = io.BytesIO()
+    pyTMD.io.OTIS.output_otis_grid(fid, xlim, ylim, hz, mz, [], 12.0)
+    assert not fid.closed
+    assert fid.getvalue() == output_file.read_bytes()
+    output_file = tmp_path.joinpath('h_synthetic')
+    pyTMD.io.OTIS.output_otis_elevation(output_file, h, xlim, ylim,
+        constituents)
+    fid = io.BytesIO()
+    pyTMD.io.OTIS.output_otis_elevation(fid, h, xlim, ylim, constituents)
+    assert fid.getvalue() == output_file.read_bytes()
+    output_file = tmp_path.joinpath('UV_synthetic')
+    pyTMD.io.OTIS.output_otis_transport(output_file, u, v, xlim, ylim,
+        constituents)
+    fid = io.BytesIO()
+    pyTMD.io.OTIS.output_otis_transport(fid, u, v, xlim, ylim,
+        constituents)
+    assert fid.getvalue() == output_file.read_bytes()
+
+# PURPOSE: test that threaded writes are identical to serial writes
+@pytest.mark.parametrize("NC", [0, 1, 5])
+def test_threaded_writes(NC):
+    xlim, ylim, constituents, random_complex, rng = synthetic_model(nc=NC)
+    h = random_complex()
+    u = random_complex()
+    v = random_complex()
+    # write elevation and transport files with and without threads
+    serial, threaded = (io.BytesIO(), io.BytesIO())
+    pyTMD.io.OTIS.output_otis_elevation(serial, h, xlim, ylim,
+        constituents, threads=1)
+    pyTMD.io.OTIS.output_otis_elevation(threaded, h, xlim, ylim,
+        constituents, threads=4)
+    assert serial.getvalue() == threaded.getvalue()
+    serial, threaded = (io.BytesIO(), io.BytesIO())
+    pyTMD.io.OTIS.output_otis_transport(serial, u, v, xlim, ylim,
+        constituents, threads=1)
+    pyTMD.io.OTIS.output_otis_transport(threaded, u, v, xlim, ylim,
+        constituents, threads=4)
+    assert serial.getvalue() == threaded.getvalue()
+
+# PURPOSE: test shifting global grids to a new base longitude
+@pytest.mark.parametrize("CYCLIC", [False, True])
+@pytest.mark.parametrize("MASKED", [False, True])
+@pytest.mark.parametrize("DIRECTION", ['west', 'east'])
+@pytest.mark.parametrize("INDEX", ['first', 'middle', 'last'])
+def test_shift(CYCLIC, MASKED, DIRECTION, INDEX):
+    rng = np.random.default_rng(2)
+    # global grid with or without a repeated cyclic column
+    nx = 37 if CYCLIC else 36
+    ny = 4
+    ix = np.arange(nx)*10.0 + 5.0
+    input_matrix = rng.normal(size=(ny, nx))
+    mask = (rng.uniform(size=(ny, nx)) < 0.3)
+    if CYCLIC:
+        input_matrix[:,-1] = input_matrix[:,0]
+        mask[:,-1] = mask[:,0]
+    if MASKED:
+        input_matrix = np.ma.array(input_matrix, mask=mask)
+    # index of the new base longitude
+    i0 = dict(first=0, middle=nx//2, last=nx-1)[INDEX]
+    # expected values from rolling the unique columns of the grid
+    unique = input_matrix[:,:-1] if CYCLIC else input_matrix
+    expected = np.roll(unique, -i0, axis=1)
+    if CYCLIC:
+        expected = np.ma.concatenate([expected, expected[:,:1]], axis=1)
+    # expected coordinates are uniformly spaced from the base longitude
+    xexp = ix[i0] + 10.0*np.arange(nx)
+    if (DIRECTION == 'west'):
+        xexp -= 360.0
+    temp, x = pyTMD.io.OTIS._shift(input_matrix, ix, x0=ix[i0],
+        direction=DIRECTION)
+    assert np.allclose(x, xexp)
+    assert np.all(np.ma.getdata(temp) == np.ma.getdata(expected))
+    assert np.ma.isMA(temp) == MASKED
+    if MASKED:
+        assert np.all(np.ma.getmaskarray(temp) == np.ma.getmaskarray(expected))
+    # verify the input coordinates are unchanged
+    assert np.all(ix == np.arange(nx)*10.0 + 5.0)
+
+# PURPOSE: test interpolating regional grids to u and v nodes
+@pytest.mark.parametrize("MASKS", [False, True])
+def test_interpolate_zeta(MASKS):
+    rng = np.random.default_rng(3)
+    ny, nx = (6, 8)
+    hz = rng.uniform(100.0, 4000.0, size=(ny, nx))
+    # land points along the eastern edge of the grid
+    hz[:,-1] = 0.0
+    for is_global in [False, True]:
+        kwargs = dict(is_global=is_global)
+        if MASKS:
+            kwargs['mu'], kwargs['mv'] = \
+                pyTMD.io.OTIS._mask_nodes(hz, is_global=is_global)
+        hu, hv = pyTMD.io.OTIS._interpolate_zeta(hz, **kwargs)
+        # interior u and v nodes average the adjacent depths
+        assert np.allclose(hu[:,1:-1], 0.5*(hz[:,:-2] + hz[:,1:-1]))
+        assert np.allclose(hv[1:,:-1], 0.5*(hz[:-1,:-1] + hz[1:,:-1]))
+        if is_global:
+            # western u nodes wrap to the eastern edge of global grids
+            assert np.all(hu[:,0] == 0.0)
+        else:
+            # western u nodes use the edge depths of regional grids
+            assert np.allclose(hu[:,0], hz[:,0])
+            regional = np.copy(hu)
+    # regional u nodes are independent of the eastern edge depths
+    hz[:,-1] = rng.uniform(100.0, 4000.0, size=ny)
+    hu, hv = pyTMD.io.OTIS._interpolate_zeta(hz, is_global=False)
+    assert np.all(hu[:,0] == regional[:,0])
+
+# PURPOSE: test interpolating global ATLAS solutions
+@pytest.mark.parametrize("TYPE", [np.float64, np.complex128])
+def test_interpolate_atlas_model(TYPE):
+    rng = np.random.default_rng(4)
+    # coarse global solution with masked values
+    xi = np.arange(1.0, 360.0, 2.0)
+    yi = np.arange(-89.0, 90.0, 2.0)
+    ny, nx = (len(yi), len(xi))
+    data = rng.normal(size=(ny, nx)).astype(TYPE)
+    if np.iscomplexobj(data):
+        data += 1j*rng.normal(size=(ny, nx))
+    mask = (rng.uniform(size=(ny, nx)) < 0.3)
+    zi = np.ma.array(data, mask=mask)
+    xs, ys, zs = pyTMD.io.OTIS.interpolate_atlas_model(xi, yi, zi,
+        spacing=0.5, chunk=100)
+    assert (zs.shape == (len(ys), len(xs))) and (zs.dtype == zi.dtype)
+    # expected values from linear bivariate splines of the data
+    def scipy_spline(z):
+        s = scipy.interpolate.RectBivariateSpline(xi, yi, z.T, kx=1, ky=1)
+        return s(xs, ys).T
+    if np.iscomplexobj(data):
+        expected = scipy_spline(data.real) + 1j*scipy_spline(data.imag)
+    else:
+        expected = scipy_spline(data)
+    assert np.allclose(zs.data, expected)
+    assert not np.any(zs.mask)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+u"""
+test_spline.py (10/2026)
+Verify linear spline interpolation against scipy bivariate splines
+
+UPDATE HISTORY:
+    Updated 10/2026: test grid indices against binary searches
+    Written 10/2026
+"""
+import pytest
+import numpy as np
+import scipy.interpolate
+import pyTMD.interpolate
+
+# PURPOSE: synthetic regional grid with output points
+def synthetic_grid(nx=13, ny=9, npts=200, seed=0):
+    rng = np.random.default_rng(seed)
+    # uniformly spaced grid coordinates
+    ilon = np.linspace(100.0, 124.0, nx)
+    ilat = np.linspace(-30.0, -14.0, ny)
+    gridlon, gridlat = np.meshgrid(ilon, ilat)
+    # random points within the grid
+    lon = rng.uniform(ilon[0], ilon[-1], size=npts)
+    lat = rng.uniform(ilat[0], ilat[-1], size=npts)
+    # points on grid nodes and cell edges
+    lon = np.concatenate([lon, gridlon.flatten(),
+        ilon, ilon, np.full((ny), ilon[0]), np.full((ny), ilon[-1])])
+    lat = np.concatenate([lat, gridlat.flatten(),
+        np.full((nx), ilat[0]), np.full((nx), ilat[-1]), ilat, ilat])
+    # synthetic function values at the grid points
+    val = np.sin(np.radians(4.0*gridlon))*np.cos(np.radians(6.0*gridlat))
+    return (ilon, ilat, val, lon, lat, rng)
+
+# PURPOSE: evaluate scipy linear bivariate splines at points
+def scipy_spline(ilon, ilat, idata, lon, lat):
+    s = scipy.interpolate.RectBivariateSpline(ilon, ilat, idata.T,
+        kx=1, ky=1)
+    return s.ev(lon, lat)
+
+# PURPOSE: test linear splines of real and complex data
+@pytest.mark.parametrize("TYPE", [np.float64, np.complex128])
+def test_spline(TYPE):
+    ilon, ilat, val, lon, lat, rng = synthetic_grid()
+    if (TYPE == np.complex128):
+        idata = val + 1j*np.flipud(val)
+        exp = scipy_spline(ilon, ilat, idata.real, lon, lat) + \
+            1j*scipy_spline(ilon, ilat, idata.imag, lon, lat)
+    else:
+        idata = np.copy(val)
+        exp = scipy_spline(ilon, ilat, idata, lon, lat)
+    # interpolate with linear splines
+    test = pyTMD.interpolate.spline(ilon, ilat, idata, lon, lat,
+        dtype=TYPE, kx=1, ky=1)
+    assert np.allclose(test.data, exp)
+    assert not np.any(test.mask)
+    # interpolate multiple layers with linear splines
+    layers = np.stack([idata, 2.0*idata, idata - 1.0])
+    test = pyTMD.interpolate.spline_many(ilon, ilat, layers, lon, lat,
+        dtype=TYPE)
+    assert test.shape == (len(lon), 3)
+    assert np.allclose(test.data[:,0], exp)
+    assert np.allclose(test.data[:,1], 2.0*exp)
+    assert np.allclose(test.data[:,2], exp - 1.0)
+    assert not np.any(test.mask)
+
+# PURPOSE: test linear splines of masked data
+@pytest.mark.parametrize("TYPE", [np.float64, np.complex128])
+def test_spline_masked(TYPE):
+    ilon, ilat, val, lon, lat, rng = synthetic_grid()
+    ny, nx = np.shape(val)
+    # mask random grid points including the grid edges
+    mask = (rng.uniform(size=(ny, nx)) < 0.2)
+    mask[0,:3] = True
+    mask[-1,-3:] = True
+    idata = np.ma.array(val.astype(TYPE), mask=mask)
+    # expected values and masks from scipy splines
+    if (TYPE == np.complex128):
+        exp = scipy_spline(ilon, ilat, idata.data.real, lon, lat) + \
+            1j*scipy_spline(ilon, ilat, idata.data.imag, lon, lat)
+    else:
+        exp = scipy_spline(ilon, ilat, idata.data, lon, lat)
+    smask = scipy_spline(ilon, ilat, mask.astype(np.float64), lon, lat)
+    # reduce mask allowing for rounding of the scipy splines
+    emask = (smask > np.finfo(np.float32).eps)
+    # interpolate with linear splines
+    test = pyTMD.interpolate.spline(ilon, ilat, idata, lon, lat,
+        dtype=TYPE, kx=1, ky=1)
+    assert np.allclose(test.data, exp)
+    assert np.all(test.mask == emask)
+    # interpolate multiple layers with linear splines
+    layers = np.ma.stack([idata, idata])
+    test = pyTMD.interpolate.spline_many(ilon, ilat, layers, lon, lat,
+        dtype=TYPE)
+    for i in range(2):
+        assert np.allclose(test.data[:,i], exp)
+        assert np.all(test.mask[:,i] == emask)
+    # interpolate with a rounded mask
+    test = pyTMD.interpolate.spline(ilon, ilat, idata, lon, lat,
+        dtype=TYPE, reducer=np.around, kx=1, ky=1)
+    assert np.all(test.mask == np.around(smask).astype(bool))
+
+# PURPOSE: test grid indices against binary searches of the grid
+@pytest.mark.parametrize("GRID", ['uniform', 'fine', 'irregular', 'descending'])
+def test_grid_indices(GRID):
+    rng = np.random.default_rng(1)
+    if (GRID == 'uniform'):
+        grid = np.linspace(-180.0, 180.0, 361)
+    elif (GRID == 'fine'):
+        # 1/30 degree grid with inexact spacing
+        grid = np.arange(0.0, 360.0, 1.0/30.0)
+    elif (GRID == 'irregular'):
+        grid = np.cumsum(rng.uniform(0.1, 2.0, size=100))
+    elif (GRID == 'descending'):
+        grid = np.linspace(90.0, -90.0, 181)
+    # random points inside and outside of the grid
+    gmin, gmax = np.min(grid), np.max(grid)
+    points = rng.uniform(gmin - 5.0, gmax + 5.0, size=1000)
+    # points exactly on the cell edges and on the last node
+    points = np.concatenate([points, grid, grid[[0, -1]],
+        np.nextafter(grid, -np.inf), np.nextafter(grid, np.inf),
+        [np.nan]])
+    exp = np.searchsorted(grid, points, side='right') - 1
+    test = pyTMD.interpolate._grid_indices(grid, points)
+    assert np.all(test == exp)